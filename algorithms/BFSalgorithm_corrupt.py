@@ -2,9 +2,10 @@ import simulator.computer as computer
 from simulator.communication import Communication
 from simulator.message import Message
 from simulator.config import NodeState
-import numpy as np
+import math
 from utils.logger_config import logger
 import simulator.Constants as Constants
+from types import MappingProxyType
 
 
 ''' 
@@ -17,6 +18,18 @@ The following data exists for every computer:
 
 colors = ["blue", "red", "green", "yellow", "purple", "pink", "orange", "cyan", "magenta", "lime", "teal", "lavender",
           "brown", "maroon", "navy", "olive", "coral", "salmon", "gold", "silver"]
+COLOR_TABLE = tuple(colors)
+NCOLORS = len(colors)
+
+# corruption settings for forwarded updates, shared by every send; the top level is read-only, the nested
+# field map stays a plain dict because corrupt_message_content() expects one, so treat it as read-only too
+_BFS_CORRUPT_CFG = MappingProxyType({
+    Constants.RESERVED_PROBABILITY_OF_LOSS: 0.6,
+    Constants.RESERVED_PROBABILITY_OF_CORRUPTION: 0.5,
+    "corruption": {
+        "distance": "_RANDOM",
+    }
+})
 
 
 def mainAlgorithm(self: computer.Computer, communication: Communication, _arrival_time, message = None):
@@ -27,24 +40,12 @@ def mainAlgorithm(self: computer.Computer, communication: Communication, _arriva
     if dist + 1 < self.distance:
         self.parent = parent
         self.distance = dist + 1
-        color_index = int(dist) % len(colors)
-        self.color = colors[color_index]
-      
-        x = {
-            "distance": self.distance,
-            "parent": self.id,
-        }
-
-
-        x_balagan = {
-            Constants.RESERVED_PROBABILITY_OF_LOSS: 0.6,
-            Constants.RESERVED_PROBABILITY_OF_CORRUPTION: 0.5,
-            "corruption": {
-                "distance": "_RANDOM",
-            }
-        }
+        self.color = COLOR_TABLE[int(dist) % NCOLORS]
 
-        communication.send_to_all(self.id, x, _arrival_time, x_balagan)
+        # only broadcast a distance strictly better than what we already announced
+        if self.distance < self.last_sent_distance:
+            self.last_sent_distance = self.distance
+            communication.send_to_all(self.id, _payload(self), _arrival_time, _BFS_CORRUPT_CFG)
 
 
 def init(self: computer.Computer, communication: Communication):
@@ -52,16 +53,20 @@ def init(self: computer.Computer, communication: Communication):
         logger.info(f"{self.id} is the root")
         self.parent = self.id
         self.distance = 0
-       
-        x = {
-            "distance": self.distance,
-            "parent": self.id,
-        }
 
-        communication.send_to_all(self.id, x)
+        communication.send_to_all(self.id, _payload(self))
+        self.last_sent_distance = self.distance
 
         self.color = "#000000"
         self.state = NodeState.TERMINATED
     else:
         self.parent = None
-        self.distance = np.inf
+        self.distance = math.inf
+        self.last_sent_distance = math.inf
+
+
+def _payload(self: computer.Computer):
+    """
+    Build the update message for this node; the root's first announcement uses the same shape as every relay.
+    """
+    return {"distance": self.distance, "parent": self.id}
@@ -2,11 +2,13 @@ import simulator.computer as computer
 from simulator.communication import Communication
 from simulator.message import Message
 from simulator.config import NodeState
-import numpy as np
+import math
 import time
 
 colors = ["blue", "red", "green", "yellow", "purple", "pink", "orange", "cyan", "magenta", "lime", "teal", "lavender",
           "brown", "maroon", "navy", "olive", "coral", "salmon", "gold", "silver"]
+COLOR_TABLE = tuple(colors)
+NCOLORS = len(colors)
 
 collapse_config = {
 }
@@ -18,40 +20,38 @@ def init(self: computer.Computer, communication: Communication):
     if self.is_root:
         self.distance = 0
         self.parent = self.id
-        self.color = colors[0]
+        self.color = COLOR_TABLE[0]
     else:
-        self.distance = np.inf
+        self.distance = math.inf
         self.parent = None
     self.number_of_comps = 5
     self.inputs = {self.id: self.id}
+    self.leader_counts = {self.id: 1}  # leader id -> number of nodes in self.inputs voting for it
     self.leader = self.id
     communication.send_to_all(self.id, f"LEADER {self.id} {self.leader}") # Send initial message to all nodes
-    self.color = colors[int(self.leader) % len(colors)]
+    self.color = COLOR_TABLE[self.leader % NCOLORS]
 
 
 def mainAlgorithm(self: computer.Computer, communication: Communication, _arrival_time, messages=None):
-    found_leader = False
     #print(f"Node {self.id} received message: {messages}")
-    message_parts = messages.split(" ")
-    #print(message_parts)
-    message_id = int(message_parts[1])
-    message_leader = int(message_parts[2])
-    self.inputs[message_id] = message_leader
+    _, message_id, message_leader = messages.split(" ", 2)
+    message_id = int(message_id)
+    message_leader = int(message_leader)
+
+    # keep the per-leader vote count in sync with self.inputs instead of rescanning it
+    old_leader = self.inputs.get(message_id)
+    if old_leader != message_leader:
+        if old_leader is not None:
+            self.leader_counts[old_leader] -= 1
+        self.leader_counts[message_leader] = self.leader_counts.get(message_leader, 0) + 1
+        self.inputs[message_id] = message_leader
     #print(self.inputs)
-    if int(message_leader) > int(self.leader):
+
+    if message_leader > self.leader:
         self.leader = message_leader
         #print(f"Node {self.id} found new leader: {self.leader}")
-        self.color = colors[int(self.leader) % len(colors)]
+        self.color = COLOR_TABLE[self.leader % NCOLORS]
         communication.send_to_all(self.id, f"LEADER {self.id} {self.leader}")
-        
-    total = 0
-    for key, value in self.inputs.items():
-        if value == self.leader:
-                total += 1
-        if total >= self.number_of_comps / 2:
-            found_leader = True
-        if not found_leader:
-            communication.send_to_all(self.id, f"LEADER {self.id} {self.leader}")
-        else:
-            self.state = NodeState.TERMINATED
-    
+
+    if self.leader_counts.get(self.leader, 0) >= self.number_of_comps / 2:
+        self.state = NodeState.TERMINATED
@@ -6,7 +6,7 @@ from utils.logger_config import logger
 ''' user implemented code that runs a broadcast algorithm'''
 
 def mainAlgorithm(self: computer.Computer, communication: Communication, _arrival_time, message: str = None):
-    if self.state != NodeState.TERMINATED:
+    if self.state is not NodeState.TERMINATED:
         communication.send_to_all(self.id, "running a broadcast", _arrival_time)
         self.color = "#7427e9"
         self.state = NodeState.TERMINATED
@@ -2,7 +2,7 @@ import simulator.computer as computer
 from simulator.communication import Communication
 from simulator.message import Message
 from simulator.config import NodeState
-import numpy as np
+import math
 from utils.logger_config import logger
 
 # collapse by message recieved
@@ -20,9 +20,10 @@ colors = ["blue", "red", "green", "yellow", "purple", "pink", "orange", "cyan",
 
 
 def mainAlgorithm(self: computer.Computer, communication: Communication, _arrival_time, message=None):
-    message_parts = message.split(" ")
-    dist = float(message_parts[-3])
-    parent = int(message_parts[-1])
+    # only the last three words ("<distance> from <parent>") carry data
+    _, dist, _, parent = message.rsplit(" ", 3)
+    dist = float(dist)
+    parent = int(parent)
 
     if dist + 1 < self.distance:
         self.parent = parent
@@ -42,4 +43,4 @@ def init(self: computer.Computer, communication: Communication):
         self.state = NodeState.TERMINATED
     else:
         self.parent = None
-        self.distance = np.inf
+        self.distance = math.inf
@@ -2,11 +2,28 @@ import simulator.computer as computer
 from simulator.communication import Communication
 from simulator.message import Message
 from simulator.config import NodeState
-import numpy as np
+import math
 from utils.logger_config import logger
-import simulator.Constants as Constants
+from types import MappingProxyType
+from simulator.Constants import RESERVED_PROBABILITY_OF_LOSS as _LOSS, RESERVED_PROBABILITY_OF_CORRUPTION as _CORR
 
 colors = ["blue", "red", "green", "yellow", "purple", "pink", "orange", "cyan", "magenta"]
+COLOR_TABLE = tuple(colors)
+NCOLORS = len(colors)
+
+# corruption settings for forwarded updates, shared by every send; the top level is read-only, the nested
+# field map stays a plain dict because corrupt_message_content() expects one, so treat it as read-only too
+_CORRUPTION_CONFIG = MappingProxyType({
+    _LOSS: 0,
+    _CORR: 1,
+    "corruption": {
+        "distance": "_RANDOM"
+    }
+})
+
+
+# corruption only rewrites field values, so the message shape is trusted unless this is switched on for debugging
+VALIDATE_MESSAGES = False
 
 
 collapse_config = None # Placeholder for collapse configuration, if needed
@@ -21,11 +38,11 @@ def init(self: computer.Computer, communication: Communication):
     if self.is_root:
         self.distance = 0
         self.parent = self.id
-        self.color = colors[0]
+        self.color = COLOR_TABLE[0]
         self.state = NodeState.ACTIVE
         self.received_corrupted = False
     else:
-        self.distance = np.inf
+        self.distance = math.inf
         self.parent = None
         self.state = NodeState.ACTIVE
         self.received_corrupted = False
@@ -50,17 +67,12 @@ def mainAlgorithm(self: computer.Computer, communication: Communication, round,
     else:
         if messages:
             for content in messages:
-                if not isinstance(content, dict):
-                    logger.warning(f"Node {self.id} received invalid message format: {content}")
-                    continue
-                    
-                received_dist = content.get("distance")
-                received_parent = content.get("parent")
-                
-                if received_dist is None or received_parent is None:
-                    logger.warning(f"Node {self.id} received incomplete message: {content}")
+                if VALIDATE_MESSAGES and not _is_valid_message(self, content):
                     continue
-                
+
+                received_dist = content["distance"]
+                received_parent = content["parent"]
+
                 # Check if this is a better path
                 if received_dist + 1 < self.distance:
                     old_distance = self.distance
@@ -73,18 +85,10 @@ def mainAlgorithm(self: computer.Computer, communication: Communication, round,
                         "parent": self.id
                     }
                     
-                    corruption_config = {
-                        Constants.RESERVED_PROBABILITY_OF_LOSS: 0,
-                        Constants.RESERVED_PROBABILITY_OF_CORRUPTION: 1,
-                        "corruption": {
-                            "distance": "_RANDOM"
-                        }
-                    }
-                    
-                    communication.send_to_all(self.id, message_content, round, corruption_config)
+                    communication.send_to_all(self.id, message_content, round, _CORRUPTION_CONFIG)
                     
                     # Update color based on distance
-                    self.color = colors[int(self.distance) % len(colors)]
+                    self.color = COLOR_TABLE[int(self.distance) % NCOLORS]
                     
                     # Log the update
                     logger.info(f"Node {self.id} updated distance from {old_distance} to {self.distance}")
@@ -94,4 +98,17 @@ def mainAlgorithm(self: computer.Computer, communication: Communication, round,
                         logger.warning(f"Node {self.id} detected corrupted distance: expected {received_dist + 1}, got {self.distance}")
                 
                 # Terminate after processing messages
-                self.state = NodeState.TERMINATED 
\ No newline at end of file
+                self.state = NodeState.TERMINATED
+
+
+def _is_valid_message(self: computer.Computer, content):
+    """
+    Debug-only check that a received message is a dict carrying both distance and parent.
+    """
+    if not isinstance(content, dict):
+        logger.warning(f"Node {self.id} received invalid message format: {content}")
+        return False
+    if content.get("distance") is None or content.get("parent") is None:
+        logger.warning(f"Node {self.id} received incomplete message: {content}")
+        return False
+    return True
@@ -2,11 +2,15 @@ import simulator.computer as computer
 from simulator.communication import Communication
 from simulator.message import Message
 from simulator.config import NodeState
-import numpy as np
 from utils.logger_config import logger
+import sys
 
 
 
+# message tag, interned so the receive check is an identity comparison
+COUNTER = sys.intern("counter")
+
+
 reorder_config = {
     "(0,1)": 1,
 }
@@ -24,18 +28,17 @@ def init(self: computer.Computer, communication: Communication):
 
     if self.id == 1:  # Node 1 starts the communication
         logger.info(f"{self.id} initiating ping-pong with Node {self.partner_id}")
-        # Send two messages with increasing counters
-        for i in range(10):
-            communication.send_message(self.id, self.partner_id, f"counter {self.counter + i}")
+        # Send ten messages with increasing counters
+        communication.send_many(self.id, self.partner_id, [(COUNTER, self.counter + i) for i in range(10)])
 
 
 
 
-def mainAlgorithm(self: computer.Computer, communication: Communication, _arrival_time, message: str = None):
-    if message.startswith("counter"):
-        parts = message.split()
-        self.counter = int(parts[1]) + 1  # increment counter
-        logger.info(f"{self.id} received counter {parts[1]}, incrementing to {self.counter}")
+def mainAlgorithm(self: computer.Computer, communication: Communication, _arrival_time, message: tuple = None):
+    tag, value = message
+    if tag is COUNTER:
+        self.counter = value + 1  # increment counter
+        logger.info(f"{self.id} received counter {value}, incrementing to {self.counter}")
 
         # send back to partner
         #communication.send_message(self.id, self.partner_id, f"counter {self.counter}", _arrival_time)
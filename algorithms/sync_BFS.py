@@ -2,10 +2,12 @@ import simulator.computer as computer
 from simulator.communication import Communication
 from simulator.message import Message
 from simulator.config import NodeState
-import numpy as np
+import math
 
 colors = ["blue", "red", "green", "yellow", "purple", "pink", "orange", "cyan", "magenta", "lime", "teal", "lavender",
           "brown", "maroon", "navy", "olive", "coral", "salmon", "gold", "silver"]
+COLOR_TABLE = tuple(colors)
+NCOLORS = len(colors)
 
 collapse_config = {
 }
@@ -20,27 +22,41 @@ def init(self: computer.Computer, communication: Communication):
     if self.is_root:
         self.distance = 0
         self.parent = self.id
-        self.color = colors[0]
+        self.color = COLOR_TABLE[0]
+        # messages sent during init arrive in round 1, exactly like a round 0 send
+        communication.send_to_all(self.id, (self.distance, self.parent))
+        self.last_sent_distance = self.distance
+        self.state = NodeState.TERMINATED
     else:
-        self.distance = np.inf
+        self.distance = math.inf
         self.parent = None
+        self.last_sent_distance = math.inf
 
 
 def mainAlgorithm(self: computer.Computer, communication: Communication, round, messages=None):
-    if round == 0:
-        # Send initial message if root
-        if self.is_root:
-            communication.send_to_all(self.id, f"INITIALIZE {self.distance} {self.parent}", round)
-            self.state = NodeState.TERMINATED
-    else:
-        for message in messages:
-            message_parts = message.split(" ")
-            dist = float(message_parts[1])
-            parent = int(message_parts[2])
-
-            if dist + 1 < self.distance:
-                self.parent = parent
-                self.distance = dist + 1
-                communication.send_to_all(self.id, f"UPDATE {self.distance} {self.id}", round)
-                self.color = colors[int(self.distance) % len(colors)]
-                self.state = NodeState.TERMINATED
+    new_distance, new_parent, changed = _bfs_relax(self.distance, self.parent, messages)
+    if changed:
+        self.parent = new_parent
+        self.distance = new_distance
+        # only broadcast a distance strictly better than what we already announced
+        if self.distance < self.last_sent_distance:
+            self.last_sent_distance = self.distance
+            communication.send_to_all(self.id, (self.distance, self.id), round)
+        self.color = COLOR_TABLE[self.distance % NCOLORS]
+        self.state = NodeState.TERMINATED
+
+
+def _bfs_relax(cur_dist, cur_parent, messages):
+    """
+    Pick the best (distance, parent) offered by this round's messages.
+
+    Returns:
+        tuple: (new_dist, new_parent, changed)
+    """
+    best_dist = cur_dist
+    best_parent = cur_parent
+    for dist, parent in messages:
+        if dist + 1 < best_dist:
+            best_dist = dist + 1
+            best_parent = parent
+    return best_dist, best_parent, best_dist < cur_dist
@@ -2,13 +2,17 @@ import simulator.computer as computer
 from simulator.communication import Communication
 from simulator.message import Message
 from simulator.config import NodeState
-import numpy as np
-import random
+from random import random as _rand
+import sys
 
 reorder_config = None  # Placeholder for reorder configuration, if needed
 
 collapse_config = None  # Placeholder for collapse configuration, if needed
 
+# message tags, interned so inbox checks are identity comparisons
+PRIORITY = sys.intern("PRIORITY")
+IN_MIS = sys.intern("IN_MIS")
+
 def init(self: computer.Computer, communication: Communication):
     """
     Initialize the node's state before starting the synchronous rounds.
@@ -22,36 +26,39 @@ def init(self: computer.Computer, communication: Communication):
 def mainAlgorithm(self: computer.Computer, communication: Communication, round, messages = None):
     step = round % 3  # 0: send priority, 1: receive priorities, 2: receive IN_MIS
 
-    if self.state == NodeState.TERMINATED:
+    if self.state is NodeState.TERMINATED:
         return
 
     if step == 0:
         # Pick random priority and broadcast
-        if self.state == NodeState.ACTIVE:
-            self.priority = random.random()
-            communication.send_to_all(self.id, f"PRIORITY {self.priority}", round)
+        if self.state is NodeState.ACTIVE:
+            self.priority = _rand()
+            communication.send_to_all(self.id, (PRIORITY, self.priority), round)
 
     elif step == 1:
         # Collect neighbors' priorities and determine if this node has the highest
-        if self.state == NodeState.ACTIVE:
-            highest = True
-            for msg in messages:
-                parts = msg.split(" ")
-                if parts[0] == "PRIORITY":
-                    neighbor_priority = float(parts[1])
-                    if neighbor_priority > self.priority:
-                        highest = False
-            if highest:
+        if self.state is NodeState.ACTIVE:
+            if _mis_highest(self.priority, messages):
                 self.in_mis = True
                 self.state = NodeState.TERMINATED
                 self.color = "blue"
-                communication.send_to_all(self.id, "IN_MIS", round)
+                communication.send_to_all(self.id, IN_MIS, round)
 
     elif step == 2:
         # If neighbor is in MIS, deactivate
-        if self.state == NodeState.ACTIVE:
+        if self.state is NodeState.ACTIVE:
             for msg in messages:
-                if msg == "IN_MIS":
+                if msg is IN_MIS:
                     self.state = NodeState.TERMINATED
                     self.color = "gray"
                     break
+
+
+def _mis_highest(my_priority, messages):
+    """
+    Return True if no neighbor's PRIORITY message beats my_priority, stopping at the first one that does.
+    """
+    for msg in messages:
+        if msg[0] is PRIORITY and msg[1] > my_priority:
+            return False
+    return True
@@ -1,6 +1,6 @@
 import simulator.computer as computer
 from simulator.communication import Communication
-import numpy as np
+from simulator.config import NodeState
 
 colors = ["blue", "red", "green", "yellow", "purple", "pink", "orange", "cyan", "magenta", "lime", "teal", "lavender",
           "brown", "maroon", "navy", "olive", "coral", "salmon", "gold", "silver"]
@@ -10,6 +10,6 @@ def mainAlgorithm(self: computer.Computer, communication: Communication, round,
     if round == 0:
         # Initialize the root node
         print(f"id = {self.id}, self.inputs = {self.inputs}")
-        self.state = 'terminated'
+        self.state = NodeState.TERMINATED
         self.outputs = {'parent': self.id, 'distance': self.id}
 
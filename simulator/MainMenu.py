@@ -6,6 +6,7 @@ choosing a topology, specifying the number of computers, uploading algorithms, a
 """
 
 import json
+from PyQt5.QtCore import QTimer
 from PyQt5.QtGui import *
 from PyQt5.QtWidgets import *
 import sys
@@ -24,6 +25,12 @@ COMBOBOX_OPTIONS = {
     "Display": "Text, Graph",
     "Logging": "Short, Long",
 }
+CUSTOM_OPTION_KEYS = ("Topology", "Root", "ID Type")  # options that are taken from the topology file in custom mode
+NUMBER_INPUT_DEBOUNCE_MS = 150  # the number of computers is validated once typing pauses for this long
+# resolved from this file so the menu does not depend on the working directory
+DESIGN_FILES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'designFiles')
+
+_stylesheet = None  # main_window.qss contents, read on the first menu() call
 
 
 class SimulationInProgressWindow(QMainWindow):
@@ -95,7 +102,6 @@ class MenuWindow(QMainWindow):
 
         if key in self.label_values:
             self.label_values[key].setText(f"{key}: <span style='color: blue;'>{value}</span>")
-            self.label_values[key].setWordWrap(True)
 
     def create_labels(self):
         """
@@ -167,6 +173,9 @@ class MenuWindow(QMainWindow):
                 self.add_number_input(checkbox_layout)  # adding the number of computers option
             count = count + 1
 
+        # the combo boxes that custom mode locks, looked up once
+        self.custom_combo_boxes = tuple(self.combo_boxes[key] for key in CUSTOM_OPTION_KEYS)
+
         checkbox_layout.setSpacing(20)
         checkbox_widget = QWidget(self)
         checkbox_widget.setLayout(checkbox_layout)
@@ -197,8 +206,19 @@ class MenuWindow(QMainWindow):
         # Initially disable the submit button
         self.submit_button.setEnabled(False)
 
-        # Connect textChanged signal to validation logic
-        self.number_input.textChanged.connect(lambda value: self.update_value("Number of Computers", value))
+        # Connect textChanged signal to validation logic, restarting the timer on every keystroke
+        self.number_input_timer = QTimer(self)
+        self.number_input_timer.setSingleShot(True)
+        self.number_input_timer.setInterval(NUMBER_INPUT_DEBOUNCE_MS)
+        self.number_input_timer.timeout.connect(self.on_number_input_settled)
+        self.number_input.textChanged.connect(lambda value: self.number_input_timer.start())
+
+    def on_number_input_settled(self):
+        """
+        Apply the number of computers once the user has stopped typing.
+        """
+        self.number_input_timer.stop()
+        self.update_value("Number of Computers", self.number_input.text())
 
     def validate_number_input(self, value):
         """
@@ -245,6 +265,10 @@ class MenuWindow(QMainWindow):
         combo_box = QComboBox(self)
         items_list = options.split(", ")
         items_list.insert(0, "")
+
+        # fill the model and select the saved value without emitting signals or repainting per item
+        combo_box.blockSignals(True)
+        combo_box.setUpdatesEnabled(False)
         combo_box.addItems(items_list)
 
         # Set the current value from saved network variables
@@ -253,6 +277,8 @@ class MenuWindow(QMainWindow):
             combo_box.setCurrentText(saved_value)
         else:
             combo_box.setCurrentText("")
+        combo_box.setUpdatesEnabled(True)
+        combo_box.blockSignals(False)
 
         layout.addWidget(combo_box)
 
@@ -296,7 +322,7 @@ class MenuWindow(QMainWindow):
         if fname:
             _, file_extension = os.path.splitext(fname)
             if file_extension.lower() == '.txt':
-                logger.info(f"file name is {fname}")
+                logger.info("file name is %s", fname)
                 self.checkbox_values["Topology File"] = fname
                 self.update_value("Topology File", fname)
                 self.handle_custom_topology()
@@ -312,43 +338,41 @@ class MenuWindow(QMainWindow):
         self.update_value("Topology File", "")
         self.number_input.setEnabled(True)
         self.number_input.setText("")
-        self.combo_boxes["Topology"].setCurrentText("")
-        self.combo_boxes["Topology"].setEnabled(True)
-        self.combo_boxes["Root"].setCurrentText("")
-        self.combo_boxes["Root"].setEnabled(True)
-        self.combo_boxes["ID Type"].setCurrentText("")
-        self.combo_boxes["ID Type"].setEnabled(True)
+        for combo_box in self.custom_combo_boxes:
+            combo_box.setCurrentText("")
+            combo_box.setEnabled(True)
         self.custom_mode_button.setText("Custom Mode: off")
 
     def handle_custom_topology(self):
         self.number_input.setText("1")
         self.number_input.setEnabled(False)
-        self.combo_boxes["Topology"].setCurrentText("Custom")
-        self.combo_boxes["Topology"].setEnabled(False)
-        self.combo_boxes["Root"].setCurrentText("Custom")
-        self.combo_boxes["Root"].setEnabled(False)
-        self.combo_boxes["ID Type"].setCurrentText("Custom")
-        self.combo_boxes["ID Type"].setEnabled(False)
+        for combo_box in self.custom_combo_boxes:
+            combo_box.setCurrentText("Custom")
+            combo_box.setEnabled(False)
         self.custom_mode_button.setText("Custom Mode: on")
 
     def on_submit_all(self):
         """
         Handle the final submission of all settings and save them to a JSON file.
         """
-        logger.debug(f"Checkbox values are: {self.checkbox_values}")
-        if any([value == "" for key, value in self.checkbox_values.items() if key != "Topology File"]):
+        if self.number_input_timer.isActive():
+            # submitted before the debounce fired, apply the typed number first
+            self.on_number_input_settled()
+            if not self.submit_button.isEnabled():
+                # the flushed number was rejected and a warning was already shown
+                return
+        logger.debug("Checkbox values are: %s", self.checkbox_values)
+        if any(value == "" for key, value in self.checkbox_values.items() if key != "Topology File"):
             QMessageBox.warning(self, 'Error', 'Please fill in all the fields before submitting.', QMessageBox.Ok)
             return
-        if self.checkbox_values["Topology File"] == '' and (
-                self.checkbox_values["Topology"] == "Custom" or
-                self.checkbox_values["Root"] == "Custom" or
-                self.checkbox_values["ID Type"] == "Custom"
-        ):
+        if self.checkbox_values["Topology File"] == '' and any(
+                self.checkbox_values[key] == "Custom" for key in CUSTOM_OPTION_KEYS):
             QMessageBox.warning(self, 'Error', 'Please upload a topology file when any custom option is selected.',
                                 QMessageBox.Ok)
             return
         with open(NETWORK_VARIABLES, "w") as f:
-            json.dump(self.checkbox_values, f, indent=4)
+            # compact one-shot dumps() takes the C encoder, dump() and indented output fall back to the Python one
+            f.write(json.dumps(self.checkbox_values))
         self.closeByExitButton = False
         self.close()
 
@@ -361,12 +385,14 @@ def menu(network_variables: dict, show_error: str):
         network_variables (dict): A dictionary of default or previously saved network variables.
         show_error (bool): Flag to indicate if a network error message should be shown.
     """
+    global _stylesheet
     app = QApplication(sys.argv)
     menu_window = MenuWindow(network_variables)
-    menu_window.setWindowIcon(QIcon('./designFiles/app_icon.jpeg'))
-    stylesheet_file = os.path.join('./designFiles', 'main_window.qss')
-    with open(stylesheet_file, 'r') as f:
-        menu_window.setStyleSheet(f.read())
+    menu_window.setWindowIcon(QIcon(os.path.join(DESIGN_FILES_DIR, 'app_icon.jpeg')))
+    if _stylesheet is None:
+        with open(os.path.join(DESIGN_FILES_DIR, 'main_window.qss'), 'r') as f:
+            _stylesheet = f.read()
+    menu_window.setStyleSheet(_stylesheet)
 
     if show_error:
         QMessageBox.warning(menu_window, 'Error', show_error, QMessageBox.Ok)
@@ -4,7 +4,11 @@ Communication module for handling message passing between computers in a simulat
 This module handles the sending and receiving of messages between computers in the network, including broadcasting messages and running algorithms.
 """
 
-import random
+from collections import defaultdict
+from itertools import repeat
+
+import numpy as np
+
 from simulator.computer import Computer
 import simulator.initializationModule as initializationModule
 from simulator.config import NodeState
@@ -13,6 +17,16 @@ from utils.logger_config import logger
 import simulator.errorModule as errorModule
 from simulator.errorModule import ReorderConfig
 
+# node states bound to module names, these are read for every message
+_ACTIVE = NodeState.ACTIVE
+_COLLAPSED = NodeState.COLLAPSED
+
+# number of random edge delays drawn at a time for single sends in async random mode
+RANDOM_BUFFER_SIZE = 65536
+
+# spawn key of the random edge delay stream derived from the run seed
+EDGE_DELAY_STREAM = 1
+
 
 class Communication:
     """
@@ -30,8 +44,25 @@ class Communication:
             network (Initialization): The initialized network containing the computers.
         """
         self.network = network
-        # dict to hold the last time message sent for the async case for each edge, (source_id, dest_id) -> time
-        self.last_arrival_time = {}
+        # the computers dict never changes after initialization, so keep a direct reference for the per-message lookups
+        self._netdict = network.network_dict
+        # last arrival time of a message on each edge for the async case, source_id -> {dest_id: time}
+        self.last_arrival_time = defaultdict(dict)
+        # random edge delays are drawn from numpy in blocks instead of one random.uniform call per message,
+        # from the run seed on a stream of their own so they do not repeat the error module's numpy draws
+        self._rng = np.random.default_rng(np.random.SeedSequence(network.seed, spawn_key=(EDGE_DELAY_STREAM,)))
+        self._random_buffer = []
+        self._random_index = 0
+        # whether each edge of a source keeps FIFO order, aligned with its connectedEdges;
+        # filled on its first random-delay broadcast
+        self._ordered_edges = {}
+        # the sync mode and delay type are fixed for a run, so pick the edge timing once instead of per message
+        if network.sync != 'Async':
+            self._edge_timing = self._sync_edge_timing
+        elif network.delay_type == 'Random':
+            self._edge_timing = self._random_edge_timing
+        else:
+            self._edge_timing = self._fixed_edge_timing
 
     # Send a message from the source computer to the destination computer
     def send_message(self, source, dest, message_info, sent_time=None, corruption_info=None):
@@ -47,68 +78,172 @@ class Communication:
             sent_time (float, optional): The time at which the message was sent. If None, defaults to 0.
             corruption_info (dict, optional): The corruption information of the message being sent.
         """
+        netdict = self._netdict
+        current_computer = netdict[source]
         # check if dest connected to source
-        if dest not in self.network.network_dict.get(source).connectedEdges:
-            logger.info(f"Cannot send message from {source} to {dest} because they are not connected.")
+        if dest not in current_computer._edges_set:
+            logger.info("Cannot send message from %s to %s because they are not connected.", source, dest)
             return
 
         if sent_time is None:
             sent_time = 0
 
-        # get the delay of that edge if async
-        if self.network.sync == 'Async':
-            if self.network.delay_type == 'Random':
-                # generate a random delay between 0 and 1
-                edge_delay = random.uniform(0, 1)
-                #logger.debug(f"Random edge delay from {source} to {dest} is {edge_delay}")
-
-                if self.network.reorder_config.is_edge_ordered(source, dest):
-                    # so we can see sent time needs to be the max of the last arrival time and the current sent time
-                    logger.debug(f"send_time before max check: {sent_time}")
-
-                    sent_time = max(sent_time, self.last_arrival_time.get((source, dest), 0))
+        sent_time, edge_delay = self._edge_timing(source, dest, sent_time)
 
-                    # sent_time = self.last_arrival_time.get((source, dest), 0)
-
-                else:
-                    #logger.debug(f"Edge {source} to {dest} is not ordered")
-                    pass
-
-            else:
-                # get the delay of the edge
-                edge_delay = self.network.get_edge_delay(source, dest)
-                logger.debug(f"Edge delay from {source} to {dest} is {edge_delay}")
-        else:
-            # in sync, we want to use a constant delay of 1 round
-            edge_delay = 1
-
-        current_computer = self.network.network_dict.get(source)
-
-        current_computer_active = current_computer.state != NodeState.COLLAPSED
-        dest_computer_active = self.network.network_dict.get(dest).state == NodeState.ACTIVE
+        dest_computer = netdict[dest]
+        current_computer_active = current_computer.state is not _COLLAPSED
+        dest_computer_active = dest_computer.state is _ACTIVE
 
         if current_computer_active and dest_computer_active:
             # creating a new message which will be put into the queue
-            message = Message(
+            message = Message.acquire(
                 source_id=source,
                 dest_id=dest,
                 arrival_time=sent_time + edge_delay,#bug here
-                content=message_info
+                content=message_info,
+                dest_computer=dest_computer
             )
 
             if corruption_info is not None:
                 message.content = errorModule.corrupt_message(message.content, corruption_info)
 
             if message.content is not None:
-                self.network.message_queue.push(message)
+                network = self.network
+                network.message_queue.push(message)
                 current_computer.update_sent_msg_count(1)
                 # Check collapse after sending the message
-                self.network.collapse_config.should_collapse(current_computer)
-                self.last_arrival_time[(source, dest)] = sent_time + edge_delay
+                network.collapse_config.should_collapse(current_computer)
+                self.last_arrival_time[source][dest] = sent_time + edge_delay
+            else:
+                # the message was lost to corruption, nothing refers to it anymore
+                Message.release(message)
+
+    def _sync_edge_timing(self, source, dest, sent_time):
+        """
+        Edge timing in sync mode: every message takes exactly one round.
+
+        Args:
+            source (int): The ID of the source computer.
+            dest (int): The ID of the destination computer.
+            sent_time (float): The time at which the message is sent.
+
+        Returns:
+            tuple: The sent time and the edge delay.
+        """
+        return sent_time, 1
+
+    def _random_edge_timing(self, source, dest, sent_time):
+        """
+        Edge timing in async mode with random delays.
+        On ordered edges the sent time is pushed back so the message cannot overtake earlier ones.
+
+        Args:
+            source (int): The ID of the source computer.
+            dest (int): The ID of the destination computer.
+            sent_time (float): The time at which the message is sent.
+
+        Returns:
+            tuple: The (possibly adjusted) sent time and the edge delay.
+        """
+        # take a random delay between 0 and 1 from the pre-drawn block
+        edge_delay = self._next_random()
+        #logger.debug("Random edge delay from %s to %s is %s", source, dest, edge_delay)
+
+        if self.network.reorder_config.is_edge_ordered(source, dest):
+            # so we can see sent time needs to be the max of the last arrival time and the current sent time
+            logger.debug("send_time before max check: %s", sent_time)
+
+            sent_time = max(sent_time, self.last_arrival_time[source].get(dest, 0))
+
+        return sent_time, edge_delay
+
+    def _next_random(self):
+        """
+        Returns the next uniform random number in [0, 1), drawing a new block when the current one is used up.
+
+        Returns:
+            float: The random number.
+        """
+        if self._random_index >= len(self._random_buffer):
+            self._random_buffer = self._rng.random(RANDOM_BUFFER_SIZE).tolist()
+            self._random_index = 0
+        value = self._random_buffer[self._random_index]
+        self._random_index += 1
+        return value
+
+    def _fixed_edge_timing(self, source, dest, sent_time):
+        """
+        Edge timing in async mode with the per-edge delays created at initialization.
+
+        Args:
+            source (int): The ID of the source computer.
+            dest (int): The ID of the destination computer.
+            sent_time (float): The time at which the message is sent.
+
+        Returns:
+            tuple: The sent time and the edge delay.
+        """
+        # get the delay of the edge
+        edge_delay = self.network.get_edge_delay(source, dest)
+        logger.debug("Edge delay from %s to %s is %s", source, dest, edge_delay)
+        return sent_time, edge_delay
+
+    def send_many(self, source, dest, messages_info, sent_time=None, corruption_info=None):
+        """
+        Sends several messages from the source computer to the same destination computer in one call.
+        Behaves like calling send_message for each message in order, but resolves the edge and both
+        computers once and inserts all messages into the queue in a single batch.
+
+        Args:
+            source (int): The ID of the source computer sending the messages.
+            dest (int): The ID of the destination computer receiving the messages.
+            messages_info (list): The contents of the messages being sent, in sending order.
+            sent_time (float, optional): The time at which the messages were sent. If None, defaults to 0.
+            corruption_info (dict, optional): The corruption information applied to each message.
+        """
+        current_computer = self._netdict[source]
+        # check if dest connected to source
+        if dest not in current_computer._edges_set:
+            logger.info("Cannot send message from %s to %s because they are not connected.", source, dest)
+            return
+
+        if sent_time is None:
+            sent_time = 0
+
+        dest_computer = self._netdict[dest]
+        last_arrival_time = self.last_arrival_time[source]
+        batch = []
+        for message_info in messages_info:
+            # the source may collapse part way through the batch, and the destination is checked per message like send_message
+            if current_computer.state is _COLLAPSED or dest_computer.state is not _ACTIVE:
+                break
+
+            message_sent_time, edge_delay = self._edge_timing(source, dest, sent_time)
+            if corruption_info is not None:
+                message_info = errorModule.corrupt_message(message_info, corruption_info)
+            if message_info is None:
+                continue
+
+            batch.append(Message.acquire(
+                source_id=source,
+                dest_id=dest,
+                arrival_time=message_sent_time + edge_delay,
+                content=message_info,
+                dest_computer=dest_computer
+            ))
+            current_computer.update_sent_msg_count(1)
+            # Check collapse after sending the message
+            self.network.collapse_config.should_collapse(current_computer)
+            last_arrival_time[dest] = message_sent_time + edge_delay
+
+        if batch:
+            self.network.message_queue.push_many(batch)
 
     def send_to_all(self, source_id, message_info, sent_time=None, corruption_info=None):
         """
         Sends a message from the source computer to all connected computers.
+        Equivalent to calling send_message for every neighbor, but the source computer, the delay
+        mode and the edge delays are resolved once per broadcast instead of once per edge.
         
         Args:
             source_id (int): The ID of the source computer sending the message.
@@ -116,9 +251,63 @@ class Communication:
             sent_time (float, optional): The time at which the message was sent. If None, defaults to 0.
             corruption_info (dict, optional): The corruption information of the message being sent.
         """
-        source_computer = self.network.network_dict.get(source_id)
-        for index, connected_computer_id in enumerate(source_computer.connectedEdges):
-            self.send_message(source_id, connected_computer_id, message_info, sent_time, corruption_info)
+        network = self.network
+        network_dict = self._netdict
+        source_computer = network_dict[source_id]
+        neighbors = source_computer.connectedEdges
+        if not neighbors or source_computer.state is _COLLAPSED:
+            return
+
+        if sent_time is None:
+            sent_time = 0
+
+        # one delay per neighbor, computed for the whole broadcast at once
+        if network.sync != 'Async':
+            # in sync, we want to use a constant delay of 1 round
+            delays = [1] * len(neighbors)
+            ordered_edges = repeat(False)
+        elif network.delay_type == 'Random':
+            # generate random delays between 0 and 1
+            delays = self._rng.random(len(neighbors)).tolist()
+            ordered_edges = self._ordered_edges.get(source_id)
+            if ordered_edges is None:
+                # the reorder configuration is rolled once at load time, so each edge's ordering never changes
+                is_edge_ordered = network.reorder_config.is_edge_ordered
+                ordered_edges = self._ordered_edges[source_id] = [is_edge_ordered(source_id, dest) for dest in neighbors]
+        else:
+            # fixed per-edge delays, aligned with connectedEdges by delays_creation
+            delays = source_computer.delays
+            ordered_edges = repeat(False)
+
+        message_queue = network.message_queue
+        collapse_config = network.collapse_config
+        last_arrival_time = self.last_arrival_time[source_id]
+        for dest, edge_delay, edge_ordered in zip(neighbors, delays, ordered_edges):
+            # the source may collapse part way through the broadcast
+            if source_computer.state is _COLLAPSED:
+                break
+            dest_computer = network_dict[dest]
+            if dest_computer.state is not _ACTIVE:
+                continue
+
+            message_sent_time = sent_time
+            if edge_ordered:
+                # sent time needs to be the max of the last arrival time and the current sent time
+                message_sent_time = max(sent_time, last_arrival_time.get(dest, 0))
+
+            content = message_info
+            if corruption_info is not None:
+                content = errorModule.corrupt_message(content, corruption_info)
+            if content is None:
+                continue
+
+            arrival_time = message_sent_time + edge_delay
+            message_queue.push(Message.acquire(source_id=source_id, dest_id=dest, arrival_time=arrival_time,
+                                               content=content, dest_computer=dest_computer))
+            source_computer.update_sent_msg_count(1)
+            # Check collapse after sending the message
+            collapse_config.should_collapse(source_computer)
+            last_arrival_time[dest] = arrival_time
 
     def receive_message(self, message: Message, comm):
         """
@@ -128,18 +317,19 @@ class Communication:
             message (Message): The message that was received.
             comm (Communication): The communication object handling the message passing.
         """
-        #if self.network.logging_type == "Long":\
         logger.info(message.to_dict())
 
-        received_computer = self.network.network_dict.get(message.dest_id)
+        received_computer = message.dest_computer
+        if received_computer is None:
+            received_computer = self._netdict[message.dest_id]
 
-        if received_computer.state != NodeState.ACTIVE:
-            logger.info(f"Computer {received_computer.id} is not active, ignoring message.")
+        if received_computer.state is not _ACTIVE:
+            logger.info("Computer %s is not active, ignoring message.", received_computer.id)
             return
 
         received_computer.update_received_msg_count(1)
         # Check if the computer should collapse after receiving the message
-        self.network.collapse_config.should_collapse(received_computer, message)
+        self.network.collapse_config.should_collapse(received_computer, message=message)
 
         self.run_algorithm(received_computer, 'mainAlgorithm', message.arrival_time, message.content)
 
@@ -153,16 +343,21 @@ class Communication:
             arrival_time (float, optional): The time the message arrived, if applicable.
             message_content (str, optional): The content of the message being processed by the algorithm.
         """
-        algorithm_function = getattr(comp.algorithm_file, function_name, None)
-        if callable(algorithm_function):
-            if function_name == 'init':
-                algorithm_function(comp, self)  # Call with two arguments
-            elif function_name == 'mainAlgorithm':
+        if function_name == 'mainAlgorithm':
+            algorithm_function = comp._main_algorithm
+            if algorithm_function is not None:
                 algorithm_function(comp, self, arrival_time, message_content)
+        elif function_name == 'init':
+            algorithm_function = comp._init_algorithm
+            if algorithm_function is not None:
+                algorithm_function(comp, self)  # Call with two arguments
+        else:
+            algorithm_function = None
 
+        if algorithm_function is not None:
             if self.network.display_type == "Graph" and comp.has_changed():
-                self.network.node_values_change.append((comp.__dict__.copy(), arrival_time))
-                comp.reset_flag()
+                # only the attributes that changed are recorded, the graph display merges them into the node's values
+                self.network.node_values_change.append((comp.pop_changes(), arrival_time))
         else:
-            logger.info(f"Error: Function '{function_name}' not found in {comp.algorithm_file}.py")
+            logger.info("Error: Function '%s' not found in %s.py", function_name, comp.algorithm_file)
             return None
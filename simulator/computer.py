@@ -7,6 +7,15 @@ from utils.logger_config import logger
 from simulator.config import NodeState
 from typing import Optional, List
 
+# attributes whose changes are not shown in the graph display; `state` tracks its own changes in its setter
+UNTRACKED_ATTRIBUTES = frozenset({
+    "algorithm_file", "id", "connectedEdges", "delays", "received_msg_count", "sent_msg_count", "state"
+})
+
+_ACTIVE = NodeState.ACTIVE
+_COLLAPSED = NodeState.COLLAPSED
+_TERMINATED = NodeState.TERMINATED
+
 
 class Computer:
     """
@@ -18,24 +27,30 @@ class Computer:
         algorithm_file (module): The algorithm file associated with this computer.
         is_root (bool): Whether this computer is designated as the root node in the network.
         color (str): The color associated with this computer, used in visualization.
-        _has_changed (bool): A private flag indicating whether the computer's state has changed.
+        _changes (dict): The attributes changed since the last reset, mapped to their new values.
+        _init_algorithm (callable): The `init` function of `algorithm_file`, or None if it has none.
+        _main_algorithm (callable): The `mainAlgorithm` function of `algorithm_file`, or None if it has none.
+        _edges_set (set of int): The same IDs as `connectedEdges`, kept as a set for constant-time connection checks.
+        _inbox (list): Reusable buffer holding the message contents delivered to this computer in the current sync round.
     """
 
     def __init__(self, new_id=None):
         """
         Initializes a Computer object with default values for attributes.
         """
-        self._has_changed = False
+        self._changes = {}
         self.id = new_id
         self.connectedEdges = []
-        self.algorithm_file = None
-        self._state = NodeState.ACTIVE
+        self._edges_set = set()  # mirrors connectedEdges, keep in sync through add_edge
+        self.algorithm_file = None  # also clears _init_algorithm and _main_algorithm
+        self._state = _ACTIVE
         self.is_root = False
         self.color = "olivedrab"
         self.inputs = {}
         self.outputs = {}
         self.received_msg_count = 0
         self.sent_msg_count = 0
+        self._inbox = []  # reused every sync round to hand this round's message contents to the algorithm
 
     @property
     def state(self) -> NodeState:
@@ -47,9 +62,9 @@ class Computer:
         """Set the state, ensuring it's a valid NodeState value."""
         if not isinstance(value, NodeState):
             raise ValueError(f"State must be a NodeState enum value, got {type(value)}")
-        if self._state != value:
-            self._has_changed = True
-            logger.info(f"Computer {self.id} is changing state from {self._state.value} to {value.value}")
+        if self._state is not value:
+            self._changes['_state'] = value
+            logger.info("Computer %s is changing state from %s to %s", self.id, self._state.value, value.value)
             self._state = value
 
     def __str__(self):
@@ -63,25 +78,24 @@ class Computer:
 
     def __setattr__(self, name, value):
         """
-        Overrides the default setattr method to set the `_has_changed` flag when non-private attributes change.
+        Overrides the default setattr method to record changes of non-private attributes in `_changes`.
 
         Args:
             name (str): The name of the attribute being set.
             value (Any): The value to set the attribute to.
         """
         # Only set the flag if the attribute is not private
-        if not name.startswith('_') and getattr(self, name,
-                                                None) != value and name != "algorithm_file" and name != "id" and name != "connectedEdges" and name != "delays" and name != "received_msg_count" and name != "sent_msg_count":
-            self._has_changed = True
+        if name[0] != '_' and name not in UNTRACKED_ATTRIBUTES and self.__dict__.get(name) != value:
+            self.__dict__['_changes'][name] = value
             # print the id and what is changing
-            logger.info(f"Computer {self.id} is changing {name} to {value}")
+            logger.info("Computer %s is changing %s to %s", self.id, name, value)
         super().__setattr__(name, value)
 
     def reset_flag(self):
         """
-        Resets the `_has_changed` flag to False.
+        Forgets the changes recorded so far.
         """
-        self._has_changed = False
+        self._changes = {}
 
     def has_changed(self):
         """
@@ -90,7 +104,22 @@ class Computer:
         Returns:
             bool: True if the state has changed, False otherwise.
         """
-        return self._has_changed
+        return bool(self._changes)
+
+    def pop_changes(self):
+        """
+        Returns the changes recorded since the last reset and starts a new record.
+        The id and message counters are included so the graph display can find the node and refresh its counts.
+
+        Returns:
+            dict: The changed attributes with their new values, plus `id`, `received_msg_count` and `sent_msg_count`.
+        """
+        changes = self._changes
+        self._changes = {}
+        changes['id'] = self.id
+        changes['received_msg_count'] = self.received_msg_count
+        changes['sent_msg_count'] = self.sent_msg_count
+        return changes
 
     def getConnectedEdges(self):
         """
@@ -101,6 +130,42 @@ class Computer:
         """
         return self.connectedEdges
 
+    @property
+    def algorithm_file(self):
+        """Get the algorithm module run on this computer."""
+        return self._algorithm_file
+
+    @algorithm_file.setter
+    def algorithm_file(self, algorithm_file):
+        """
+        Set the algorithm module and look up its entry points once,
+        so running the algorithm does not search the module on every message.
+        """
+        self._algorithm_file = algorithm_file
+        init_function = getattr(algorithm_file, 'init', None)
+        main_function = getattr(algorithm_file, 'mainAlgorithm', None)
+        self._init_algorithm = init_function if callable(init_function) else None
+        self._main_algorithm = main_function if callable(main_function) else None
+
+    def set_algorithm_file(self, algorithm_file):
+        """
+        Assigns the algorithm module to the computer.
+
+        Args:
+            algorithm_file (module): The algorithm module to run on this computer.
+        """
+        self.algorithm_file = algorithm_file
+
+    def add_edge(self, dest_id):
+        """
+        Connects this computer to another computer.
+
+        Args:
+            dest_id (int): The ID of the computer to connect to.
+        """
+        self.connectedEdges.append(dest_id)
+        self._edges_set.add(dest_id)
+
     def getDelays(self):
         """
         Returns the list of delays for the connected edges.
@@ -114,27 +179,28 @@ class Computer:
         """
         Collapses the computer.
         """
-        self.state = NodeState.COLLAPSED
-        logger.info(f"Computer {self.id} has collapsed")
-        logger.debug(f"Computer {self.id} has collapsed")
+        self.state = _COLLAPSED
+        logger.info("Computer %s has collapsed", self.id)
+        logger.debug("Computer %s has collapsed", self.id)
 
     def terminate(self):
         """
         Terminates the computer.
         """
-        self.state = NodeState.TERMINATED
-        logger.info(f"Computer {self.id} has terminated")
-        logger.debug(f"Computer {self.id} has terminated")
+        self.state = _TERMINATED
+        logger.info("Computer %s has terminated", self.id)
+        logger.debug("Computer %s has terminated", self.id)
 
     def update_received_msg_count(self, delta):
         """
         Updates the received message count for the computer.
         """
         logger.debug("Updating received message count for computer %s by %s", self.id, delta)
-        self.received_msg_count += delta
+        # counters are untracked, so skip __setattr__ and write the instance dict directly
+        self.__dict__['received_msg_count'] += delta
 
     def update_sent_msg_count(self, delta):
         """
         Updates the sent message count for the computer.
         """
-        self.sent_msg_count += delta
+        self.__dict__['sent_msg_count'] += delta
@@ -1,10 +1,12 @@
-from enum import Enum
+from enum import Enum, unique
 
 
+@unique
 class NodeState(Enum):
     """
     Enumeration of possible node states.
     Only these three states are allowed in the system.
+    Members are singletons, so state checks can use `is`.
     """
     ACTIVE = "active"      # Node is functioning normally
     COLLAPSED = "collapsed"  # Node has failed/collapsed
@@ -16,9 +18,9 @@ class NodeState(Enum):
         Check if a state is one of the valid system states.
         
         Args:
-            state (str): The state to check
+            state (NodeState): The state to check
             
         Returns:
             bool: True if the state is valid, False otherwise
         """
-        return state in {NodeState.ACTIVE, NodeState.COLLAPSED, NodeState.TERMINATED}
\ No newline at end of file
+        return isinstance(state, NodeState)
\ No newline at end of file
@@ -1,4 +1,6 @@
 # simulator/data_structures/custom_dict.py
+from collections import defaultdict
+
 from simulator.message import Message
 
 class CustomDict:
@@ -6,14 +8,15 @@ class CustomDict:
     A class to represent a custom dictionary for managing messages.
 
     Attributes:
-        dict (dict): A dictionary used to store messages with their destination IDs as keys.
+        dict (defaultdict): Messages grouped by destination ID, then by arrival round: dest_id -> {round: [messages]}.
     """
 
     def __init__(self):
         """
         Initializes the custom dictionary.
         """
-        self.dict = {}
+        self.dict = defaultdict(lambda: defaultdict(list))
+        self._count = 0  # number of messages currently held, kept up to date so size() does not walk the buckets
         self.total_messages_sent = 0
         self.total_messages_received = 0
 
@@ -24,15 +27,20 @@ class CustomDict:
         Args:
             message (Message): The message to add.
         """
-        dest_id = message.dest_id
-        round = message.arrival_time
-        key = (dest_id, round)
-
-        if key not in self.dict:
-            self.dict[key] = []
-        self.dict[key].append(message)
+        self.dict[message.dest_id][message.arrival_time].append(message)
+        self._count += 1
         self.total_messages_sent += 1
 
+    def push_many(self, messages: list[Message]):
+        """
+        Adds several messages to the dictionary.
+
+        Args:
+            messages (list[Message]): The messages to add.
+        """
+        for message in messages:
+            self.push(message)
+
     def remove(self, message: Message):
         """
         Removes a message from the dictionary.
@@ -41,9 +49,14 @@ class CustomDict:
             message (Message): The message to remove.
         """
         dest_id = message.dest_id
-        if dest_id in self.dict:
-            self.dict[dest_id].remove(message)
-            if not self.dict[dest_id]:
+        rounds = self.dict.get(dest_id)
+        if rounds and message.arrival_time in rounds:
+            messages = rounds[message.arrival_time]
+            messages.remove(message)
+            self._count -= 1
+            if not messages:
+                del rounds[message.arrival_time]
+            if not rounds:
                 del self.dict[dest_id]
 
     def contains(self, message: Message) -> bool:
@@ -56,8 +69,8 @@ class CustomDict:
         Returns:
             bool: True if the dictionary contains the message, False otherwise.
         """
-        dest_id = message.dest_id
-        return dest_id in self.dict and message in self.dict[dest_id]
+        rounds = self.dict.get(message.dest_id)
+        return bool(rounds) and message in rounds.get(message.arrival_time, ())
 
     def empty(self) -> bool:
         """
@@ -75,18 +88,19 @@ class CustomDict:
         Returns:
             int: The number of elements in the dictionary.
         """
-        return sum(len(messages) for messages in self.dict.values())
+        return self._count
 
     def clear(self):
         """
         Clears the dictionary.
         """
         self.dict.clear()
+        self._count = 0
 
     def get_messages_for_specific_dest(self, dest_id, current_round) -> list[Message]:
         """
-        Returns all messages in the dictionary for a specific destination ID and round.
-        If dest_id is not in the dictionary, return an empty list.
+        Returns all messages in the dictionary for a specific destination ID and round, and removes them.
+        If there are no such messages, return an empty list.
 
         Args:
             dest_id (int): The destination ID for which to retrieve messages.
@@ -95,19 +109,27 @@ class CustomDict:
         Returns:
             list[Message]: A list of messages for the specified destination ID and round.
         """
-        key = (dest_id, current_round)
-        self.total_messages_received += len(self.dict.get(key, []))
-        return self.dict.get(key, [])
+        rounds = self.dict.get(dest_id)
+        if not rounds:
+            return []
+        # delivered rounds are dropped right away so the buckets only hold undelivered messages
+        messages = rounds.pop(current_round, [])
+        if not rounds:
+            del self.dict[dest_id]
+        self._count -= len(messages)
+        self.total_messages_received += len(messages)
+        return messages
 
     def clear_key(self, dest_id):
         """
-        Removes the key from the dictionary.
+        Removes every message waiting for a destination, in all rounds.
 
         Args:
             dest_id (int): The destination ID to remove.
         """
-        if dest_id in self.dict:
-            del self.dict[dest_id]
+        rounds = self.dict.pop(dest_id, None)
+        if rounds:
+            self._count -= sum(len(messages) for messages in rounds.values())
 
     def get_all_messages(self) -> list[Message]:
         """
@@ -116,4 +138,4 @@ class CustomDict:
         Returns:
             list[Message]: A list of all messages in the dictionary.
         """
-        return [msg for messages in self.dict.values() for msg in messages]
+        return [msg for rounds in self.dict.values() for messages in rounds.values() for msg in messages]
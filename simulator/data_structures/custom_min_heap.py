@@ -1,4 +1,4 @@
-import heapq
+from heapq import heapify, heappop, heappush
 from simulator.message import Message
 
 class CustomMinHeap:
@@ -26,10 +26,32 @@ class CustomMinHeap:
         Args:
             message (Message): The message to add.
         """
-        heapq.heappush(self.heap, (message.arrival_time, self.counter, message))
-        self.counter += 1
+        counter = self.counter
+        heappush(self.heap, (message.arrival_time, counter, message))
+        self.counter = counter + 1
         self.total_messages_sent += 1
 
+    def push_many(self, messages: list[Message]):
+        """
+        Pushes several messages onto the heap at once.
+        Messages with equal arrival times keep the order in which they are given.
+
+        Args:
+            messages (list[Message]): The messages to add.
+        """
+        start = self.counter
+        entries = [(message.arrival_time, start + i, message) for i, message in enumerate(messages)]
+        self.counter += len(entries)
+        self.total_messages_sent += len(entries)
+        if len(entries) > len(self.heap):
+            # cheaper to rebuild the heap in linear time than to sift every entry in
+            self.heap.extend(entries)
+            heapify(self.heap)
+        else:
+            heap = self.heap
+            for entry in entries:
+                heappush(heap, entry)
+
     def pop(self) -> Message:
         """
         Pops the message with the smallest arrival time from the heap.
@@ -37,10 +59,37 @@ class CustomMinHeap:
         Returns:
             Message: The message with the smallest arrival time.
         """
-        priority, priority2, message = heapq.heappop(self.heap)
+        # the sequence number in the entry is unique, so the comparison never reaches the message itself
+        message = heappop(self.heap)[2]
         self.total_messages_received += 1
         return message
 
+    def pop_until(self, time) -> list[Message]:
+        """
+        Pops every message whose arrival time is at most the given time.
+
+        Args:
+            time (float): The latest arrival time to pop.
+
+        Returns:
+            list[Message]: The popped messages, in the order pop() would have returned them.
+        """
+        heap = self.heap
+        messages = []
+        while heap and heap[0][0] <= time:
+            messages.append(heappop(heap)[2])
+        self.total_messages_received += len(messages)
+        return messages
+
+    def peek_time(self):
+        """
+        Returns the arrival time of the next message without popping it.
+
+        Returns:
+            float: The smallest arrival time in the heap.
+        """
+        return self.heap[0][0]
+
     def empty(self) -> bool:
         """
         Checks whether the heap is empty.
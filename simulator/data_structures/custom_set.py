@@ -13,6 +13,20 @@ class CustomSet:
         """
         self.set = set()
 
+    @staticmethod
+    def _key(message_format):
+        """
+        Returns the hashable form under which a message is stored.
+        A frozenset of the items does not depend on the order in which the dict was built.
+
+        Args:
+            message_format (dict): The message format.
+
+        Returns:
+            frozenset: The (key, value) pairs of the message.
+        """
+        return frozenset(message_format.items())
+
     def push(self, message_format):
         """
         Adds a message to the set.
@@ -20,17 +34,16 @@ class CustomSet:
         Args:
             message_format (dict): The message format to add.
         """
-        self.set.add(tuple(message_format.items()))
-
+        self.set.add(self._key(message_format))
 
     def remove(self, message_format):
-            """
-            Removes a message from the set.
+        """
+        Removes a message from the set.
 
-            Args:
-                message_format (dict): The message format to remove.
-            """
-            self.set.remove(message_format)
+        Args:
+            message_format (dict): The message format to remove.
+        """
+        self.set.remove(self._key(message_format))
 
     def contains(self, message_format) -> bool:
         """
@@ -42,7 +55,7 @@ class CustomSet:
         Returns:
             bool: True if the set contains the message, False otherwise.
         """
-        return message_format in self.set
+        return self._key(message_format) in self.set
 
     def empty(self) -> bool:
         """
@@ -28,9 +28,14 @@ class UnionFind:
         Returns:
             int: The root of the node.
         """
-        if self.parent[node] != node:
-            self.parent[node] = self.find(self.parent[node])  # Path compression
-        return self.parent[node]
+        parent = self.parent
+        root = node
+        while parent[root] != root:
+            root = parent[root]
+        # Path compression, done iteratively so long chains cannot hit the recursion limit
+        while parent[node] != root:
+            parent[node], node = root, parent[node]
+        return root
 
     def union(self, node1, node2):
         """
@@ -39,16 +44,37 @@ class UnionFind:
         Args:
             node1 (int): First node.
             node2 (int): Second node.
+
+        Returns:
+            bool: True if the two nodes were in different sets, False if they were already united.
         """
         root1 = self.find(node1)
         root2 = self.find(node2)
 
-        if root1 != root2:
-            # Union by rank
-            if self.rank[root1] > self.rank[root2]:
-                self.parent[root2] = root1
-            elif self.rank[root1] < self.rank[root2]:
-                self.parent[root1] = root2
-            else:
-                self.parent[root2] = root1
-                self.rank[root1] += 1
+        if root1 == root2:
+            return False
+
+        parent = self.parent
+        rank = self.rank
+        # Union by rank
+        if rank[root1] > rank[root2]:
+            parent[root2] = root1
+        elif rank[root1] < rank[root2]:
+            parent[root1] = root2
+        else:
+            parent[root2] = root1
+            rank[root1] += 1
+        return True
+
+    def union_many(self, pairs):
+        """
+        Unites the sets of every pair of nodes, e.g. every edge of a graph.
+
+        Args:
+            pairs (iterable of tuple): The (node1, node2) pairs to unite.
+
+        Returns:
+            int: The number of unions that merged two different sets.
+        """
+        union = self.union
+        return sum(union(node1, node2) for node1, node2 in pairs)
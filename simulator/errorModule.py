@@ -3,8 +3,13 @@ Error module for handling node failures and collapse conditions in the distribut
 
 This module defines the configuration and conditions for node failures/collapses in the network.
 """
+import math
+import numbers
 import random
 import string
+import struct
+from collections import deque
+from itertools import islice
 
 import numpy as np
 
@@ -12,6 +17,95 @@ import simulator.Constants as Constants
 from utils.logger_config import logger
 from simulator.config import NodeState
 
+# numpy generator for the error module's Poisson draws and long list shuffles, replaced by seed_random_generators()
+_rng = np.random.default_rng()
+
+# the error module's own Mersenne Twister for every other draw; the bound C method of random() is the cheapest
+# per-call draw available, cheaper than indexing into a pre-drawn numpy block through a Python helper.
+# seed_random_generators() reseeds it in place, so the bound method stays valid
+_random = random.Random()
+_next_rand = _random.random
+
+
+def seed_random_generators(seed):
+    """
+    Seed the error module's random generators, so the loss, corruption, reorder and collapse draws of a run
+    can be replayed from its seed.
+
+    Args:
+        seed (int): The run seed, None draws fresh entropy from the OS
+    """
+    global _rng
+    _random.seed(seed)
+    _rng = np.random.default_rng(np.random.SeedSequence(seed))
+
+
+_MASK_64 = (1 << 64) - 1
+
+
+def _collapse_uniform(seed, node_id, current_round):
+    """
+    Returns a uniform number in [0, 1) determined only by the seed, the node and the round (a splitmix64 hash),
+    so a single collapse decision can be recomputed without replaying the draws that came before it.
+
+    Args:
+        seed (int): The run's collapse seed
+        node_id (int): The ID of the node deciding whether to collapse
+        current_round (int): The current round number
+
+    Returns:
+        float: The random number.
+    """
+    x = (seed ^ (node_id * 0x9E3779B97F4A7C15) ^ (current_round * 0xC2B2AE3D27D4EB4F)) & _MASK_64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    x ^= x >> 31
+    return (x >> 11) * (1.0 / (1 << 53))
+
+
+# above this mean the inverse-CDF walk gets long and exp(-lam) heads towards underflow, so numpy samples instead
+POISSON_ICDF_MAX_LAMBDA = 30
+
+
+def _poisson_icdf(lam, u):
+    """
+    Draws a Poisson value by inverting its CDF at a uniform sample, so nearby lambdas given the same
+    sample give the same or neighbouring counts.
+
+    Args:
+        lam (float): The Poisson mean
+        u (float): A uniform random number in [0, 1)
+
+    Returns:
+        int: The smallest k whose cumulative probability reaches u
+    """
+    k = 0
+    probability = math.exp(-lam)
+    cumulative = probability
+    while u > cumulative:
+        k += 1
+        probability *= lam / k
+        if probability == 0.0:
+            # float rounding left the tail short of u
+            break
+        cumulative += probability
+    return k
+
+
+def _poisson_draw(lam):
+    """
+    Draws a Poisson value, by inverse CDF up to POISSON_ICDF_MAX_LAMBDA and from numpy above it.
+
+    Args:
+        lam (float): The Poisson mean
+
+    Returns:
+        int: The drawn value
+    """
+    if lam <= POISSON_ICDF_MAX_LAMBDA:
+        return _poisson_icdf(lam, _next_rand())
+    return int(_rng.poisson(lam))
+
 
 class CollapseConfig:
     """
@@ -25,6 +119,7 @@ class CollapseConfig:
             - probability (float): Probability of collapse when conditions are met
             - received_msg_count (int): Number of messages to receive before collapse
             - sent_msg_count (int): Number of messages to send before collapse
+        seed (int): Seed of the run's random draws, random unless configured
     """
 
     def __init__(self, config_dict=None):
@@ -37,13 +132,21 @@ class CollapseConfig:
             {
                 "1": {"round": 2, "round_reoccurence": 1, "probability": 1},
                 "2": {"round": 3, "received_msg_count": 5},
-                "3": {"sent_msg_count": 3, "probability": 0.5}
+                "3": {"sent_msg_count": 3, "probability": 0.5},
+                "seed": 12345  # optional, replays the run's random draws
             }
         """
         self.node_configs = {}
         self.overall_collapse_percent = 0.0
         self.estimated_rounds_number = 100
         self.collapsed_nodes = set()
+        # seed of the run's random draws, logged at the end so a run's decisions can be replayed
+        self.seed = random.getrandbits(64)
+        # number of nodes to collapse randomly over the whole run, fixed once the network size is known
+        self._target_collapse_count = None
+        # computers that were still active at the last random collapse round, a computer that collapsed or
+        # terminated never runs its algorithm again, so each round only needs to re-check this shrinking list
+        self._random_candidates = None
 
         # object to update each collapse, for the log at the end of the program
         self.collapse_log = {}
@@ -51,6 +154,7 @@ class CollapseConfig:
         if config_dict is not None:
             self.overall_collapse_percent = config_dict.get("overall", 0.0)
             self.estimated_rounds_number = config_dict.get("rounds_number", 100)
+            self.seed = config_dict.get("seed", self.seed)
 
             for node_id, node_config in config_dict.items():
                 if node_id == "overall":
@@ -65,6 +169,81 @@ class CollapseConfig:
                         'sent_msg_count': node_config.get('sent_msg_count')
                     }
 
+        # the collapse check of each configured node, holding only the conditions that node actually uses
+        self._checkers = {}
+        for node_id, node_config in self.node_configs.items():
+            checker = self._build_checker(node_id, node_config, self.seed)
+            if checker is not None:
+                self._checkers[node_id] = checker
+
+    @staticmethod
+    def _build_checker(node_id, node_config, seed):
+        """
+        Build the collapse check of a single node, leaving out every condition it does not configure.
+
+        Args:
+            node_id (int): The ID of the node
+            node_config (dict): The node's collapse configuration, as stored in `node_configs`
+            seed (int): The seed of the per-(node, round) probability draws
+
+        Returns:
+            callable: check(computer, current_round) returning True if the node should collapse now,
+            or None if the configuration has no collapse condition
+        """
+        checks = []
+
+        collapse_round = node_config['round']
+        if collapse_round is not None:
+            reoccurrence = node_config['round_reoccurrence']
+            if reoccurrence:
+                def round_check(computer, current_round):
+                    # Check if we're at a round where collapse should occur
+                    return (current_round is not None and current_round >= collapse_round and
+                            (current_round - collapse_round) % reoccurrence == 0)
+            else:
+                def round_check(computer, current_round):
+                    return current_round == collapse_round
+            checks.append(round_check)
+
+        received_limit = node_config['received_msg_count']
+        if received_limit is not None:
+            checks.append(lambda computer, current_round: computer.received_msg_count >= received_limit)
+
+        sent_limit = node_config['sent_msg_count']
+        if sent_limit is not None:
+            checks.append(lambda computer, current_round: computer.sent_msg_count >= sent_limit)
+
+        if not checks:
+            return None
+
+        probability = node_config['probability']
+        checks = tuple(checks)
+
+        def check(computer, current_round):
+            # Apply probability check, sync rounds draw from (seed, node, round) so one decision can be reproduced
+            if probability < 1:
+                if current_round is None:
+                    draw = _next_rand()
+                else:
+                    draw = _collapse_uniform(seed, node_id, current_round)
+                if draw > probability:
+                    return False
+            for condition in checks:
+                if condition(computer, current_round):
+                    return True
+            return False
+
+        return check
+
+    def set_total_nodes(self, total_nodes):
+        """
+        Set the network size and compute how many nodes should collapse randomly over the whole run.
+
+        Args:
+            total_nodes (int): Number of computers in the network
+        """
+        self._target_collapse_count = int(total_nodes * self.overall_collapse_percent)
+
     def maybe_collapse_randomly(self, all_computers):
         """
         Randomly collapse a subset of active computers based on the overall percentage.
@@ -76,39 +255,48 @@ class CollapseConfig:
         if total_nodes == 0 or self.overall_collapse_percent <= 0:
             return
 
-        # Filter only active and not-yet-collapsed nodes
-        candidates = [
-            c for c in all_computers.values()
-            if hasattr(c, 'state') and c.state == NodeState.ACTIVE and c.id not in self.collapsed_nodes
-        ]
+        if self._target_collapse_count is None:
+            self.set_total_nodes(total_nodes)
+        target_collapse_count = self._target_collapse_count
+        remaining_to_collapse = target_collapse_count - len(self.collapsed_nodes)
 
-        if not candidates:
+        # once the quota is met there is nothing left to do in any later round
+        if remaining_to_collapse <= 0:
             return
 
-        target_collapse_count = int(total_nodes * self.overall_collapse_percent)
-        remaining_to_collapse = target_collapse_count - len(self.collapsed_nodes)
+        # Filter only active and not-yet-collapsed nodes, every Computer has a state so no hasattr check is needed
+        previous_candidates = self._random_candidates
+        if previous_candidates is None:
+            previous_candidates = all_computers.values()
+        active = NodeState.ACTIVE
+        collapsed_nodes = self.collapsed_nodes
+        candidates = [
+            c for c in previous_candidates
+            if c.state is active and c.id not in collapsed_nodes
+        ]
+        self._random_candidates = candidates
 
-        if remaining_to_collapse <= 0:
+        if not candidates:
             return
 
-        logger.debug(f"Total nodes: {total_nodes}, Target collapse count: {target_collapse_count}, "
-                     f"Remaining to collapse: {remaining_to_collapse}")
+        logger.debug("Total nodes: %s, Target collapse count: %s, Remaining to collapse: %s",
+                     total_nodes, target_collapse_count, remaining_to_collapse)
 
         # Estimate how many to collapse this round (can use Poisson or a fixed small number)
         parameter = self.estimated_rounds_number
         dynamic_lambda = max(1, remaining_to_collapse / parameter)  # Ensure at least 1 node is selected
-        logger.debug(f"Dynamic lambda for collapse: {dynamic_lambda}")
-        num_to_collapse = min(len(candidates), np.random.poisson(dynamic_lambda), remaining_to_collapse)
-        logger.debug(f"Number of nodes to collapse this round: {num_to_collapse}")
+        logger.debug("Dynamic lambda for collapse: %s", dynamic_lambda)
+        num_to_collapse = min(len(candidates), _poisson_draw(dynamic_lambda), remaining_to_collapse)
+        logger.debug("Number of nodes to collapse this round: %s", num_to_collapse)
 
         # Randomly select and collapse
         if num_to_collapse > 0:
-            selected = random.sample(candidates, num_to_collapse)
+            selected = _random.sample(candidates, num_to_collapse)
             for comp in selected:
                 #comp.collapse()
                 self.collapse_node(comp)
                 self.collapsed_nodes.add(comp.id)
-                logger.info(f"Node {comp.id} randomly collapsed (overall={self.overall_collapse_percent})")
+                logger.info("Node %s randomly collapsed (overall=%s)", comp.id, self.overall_collapse_percent)
 
     def should_collapse(self, computer, current_round=None, message=None):
         """
@@ -123,50 +311,22 @@ class CollapseConfig:
             bool: True if the computer should collapse, False otherwise
         """
         #logger.debug(f"checking collapse, computer: {computer.id}, current_round: {current_round}, curr received msg: {getattr(computer, 'received_msg_count', 0)}, ")
-        # quick check if node active just make sure computer is not none and has state
-        if computer is None:
+        # nothing to check when no node has a collapse condition, the common case when only "overall" is set
+        if not self._checkers:
             return
 
-        if not hasattr(computer, 'state') or computer.state != NodeState.ACTIVE:
-            logger.debug(f"computer {computer.id} is not active, skipping collapse check")
-            return
-
-        # Quick check if this node has a collapse configuration
-        node_config = self.node_configs.get(computer.id)
-        if not node_config:
-            return
-
-            # Apply probability check
-        if random.random() > node_config['probability']:
+        # quick check if node active, every Computer has a state so only None needs guarding
+        if computer is None:
             return
 
-            # Check round number (for sync mode)
-        if current_round is not None and node_config['round'] is not None:
-            if node_config['round_reoccurrence']:
-                # Check if we're at a round where collapse should occur
-                if (current_round >= node_config['round'] and
-                        (current_round - node_config['round']) % node_config['round_reoccurrence'] == 0):
-                    self.collapse_node(computer)
-                    return
-            elif current_round == node_config['round']:
-                self.collapse_node(computer)
-                return
-
-        # Check received message count
-        if (node_config['received_msg_count'] is not None and
-                hasattr(computer, 'received_msg_count') and
-                computer.received_msg_count >= node_config['received_msg_count']):
-            self.collapse_node(computer)
+        if computer.state is not NodeState.ACTIVE:
+            logger.debug("computer %s is not active, skipping collapse check", computer.id)
             return
 
-        # Check sent message count
-        if (node_config['sent_msg_count'] is not None and
-                hasattr(computer, 'sent_msg_count') and
-                computer.sent_msg_count >= node_config['sent_msg_count']):
+        # Quick check if this node has a collapse configuration
+        checker = self._checkers.get(computer.id)
+        if checker is not None and checker(computer, current_round):
             self.collapse_node(computer)
-            return
-
-        return
 
     def collapse_node(self, computer, round_number=None):
         """
@@ -175,7 +335,7 @@ class CollapseConfig:
         Args:
             computer: Computer object to collapse
         """
-        if computer is None or not hasattr(computer, 'state'):
+        if computer is None:
             return
 
         # Collapse the node and update its state
@@ -185,8 +345,8 @@ class CollapseConfig:
         # Log the collapse event, message received, and message sent, and if round is not None, include it
         self.collapse_log[computer.id] = {
             'round': round_number,
-            'received_msg_count': getattr(computer, 'received_msg_count', 0),
-            'sent_msg_count': getattr(computer, 'sent_msg_count', 0)
+            'received_msg_count': computer.received_msg_count,
+            'sent_msg_count': computer.sent_msg_count
         }
 
 
@@ -203,8 +363,10 @@ class CollapseConfig:
         return self.node_configs.get(node_id)
 
     def __str__(self):
-        """String representation of the collapse configuration."""
-        return f"CollapseConfig(nodes={list(self.node_configs.keys())})"
+        """String representation of the collapse configuration, listing at most the first 20 node IDs."""
+        node_ids = list(islice(self.node_configs, 20))
+        more = "..." if len(self.node_configs) > len(node_ids) else ""
+        return f"CollapseConfig(nodes={node_ids}{more})"
 
     # function to log at the end of the program the number of collapsed nodes and what time they collapsed
     def log_collapse_statistics(self):
@@ -213,6 +375,7 @@ class CollapseConfig:
         """
         # iterate collapse log and print
         logger.summary("=== ERROR MODULE COLLAPSE STATISTICS ===")
+        logger.summary("Collapse seed: %s", self.seed)
         if self.collapse_log:
             logger.summary("Collapse Config Class Log:")
             for node_id, collapse_info in self.collapse_log.items():
@@ -233,6 +396,7 @@ class ReorderConfig:
 
     Attributes:
         unordered_edges (set): Set of unordered edges represented as tuples (min(source, dest), max(source, dest)).
+        _unordered_pairs (frozenset): The unordered edges in both directions, so lookups need no normalization.
     """
 
     def __init__(self, config_dict=None):
@@ -243,6 +407,7 @@ class ReorderConfig:
             config_dict (dict): Configuration dictionary from algorithm file
         """
         self.unordered_edges = set()
+        self._unordered_pairs = frozenset()
         self.roll_the_dice(config_dict)
 
     def roll_the_dice(self, config_dict):
@@ -259,9 +424,11 @@ class ReorderConfig:
             # Normalize edge representation
             source, dest = map(int, edge.strip("()").split(","))
             normalized_edge = (min(source, dest), max(source, dest))
-            if random.random() < probability:
+            if _next_rand() < probability:
                 self.unordered_edges.add(normalized_edge)
 
+        self._unordered_pairs = frozenset(self.unordered_edges).union((dest, source) for source, dest in self.unordered_edges)
+
     def is_edge_ordered(self, source, dest):
         """
         Check if the edge is ordered.
@@ -273,9 +440,8 @@ class ReorderConfig:
         Returns:
             bool: True if the edge is ordered, False otherwise
         """
-        # Normalize edge representation
-        normalized_edge = (min(source, dest), max(source, dest))
-        return normalized_edge not in self.unordered_edges
+        # both directions are stored, so the pair is looked up as given
+        return (source, dest) not in self._unordered_pairs
 
     def log_reorder_statistics(self):
         """
@@ -288,6 +454,11 @@ class ReorderConfig:
             logger.summary("No unordered edges configured.")
         logger.summary("=== END OF ERROR MODULE REORDER STATISTICS ===")
 
+
+# number of recent loss/corruption events kept in MessageCorruptionStats.corruption_log
+CORRUPTION_LOG_SIZE = 1024
+
+
 class MessageCorruptionStats:
     """
     Statistics tracking class for message corruption operations.
@@ -315,7 +486,8 @@ class MessageCorruptionStats:
         self.corruption_by_field = {}
         self.loss_attempts = 0
         self.corruption_attempts = 0
-        self.corruption_log = []
+        # only the most recent events are kept, a long run would otherwise hold one entry per lost or corrupted message
+        self.corruption_log = deque(maxlen=CORRUPTION_LOG_SIZE)
         
     def record_message_processed(self):
         """Record that a message was processed."""
@@ -408,7 +580,7 @@ class MessageCorruptionStats:
         # Log recent corruption events (last 10)
         if self.corruption_log:
             logger.summary("Recent corruption events:")
-            recent_events = self.corruption_log[-10:] if len(self.corruption_log) > 10 else self.corruption_log
+            recent_events = list(self.corruption_log)[-10:]
             for event in recent_events:
                 if event['type'] == 'loss':
                     logger.summary(f"  [Loss] Message: {event['message'][:50]}... (p={event['probability']})")
@@ -434,6 +606,11 @@ class MessageCorruptionStats:
 corruption_stats = MessageCorruptionStats()
 
 
+# corruption_info keys, bound once instead of resolved through Constants on every message
+_LOSS_KEY = Constants.RESERVED_PROBABILITY_OF_LOSS
+_CORRUPTION_KEY = Constants.RESERVED_PROBABILITY_OF_CORRUPTION
+
+
 # function to get corruption info and the message content and do
 def corrupt_message(message_content, corruption_info):
     # Record that we're processing a message
@@ -442,27 +619,26 @@ def corrupt_message(message_content, corruption_info):
     if corruption_info is None:
         return message_content
 
-    if corruption_info.get(Constants.RESERVED_PROBABILITY_OF_LOSS) is not None:
+    loss_probability = corruption_info.get(_LOSS_KEY)
+    if loss_probability is not None:
         # get random number between 0 and 1
-        random_number = random.random()
-        loss_probability = corruption_info.get(Constants.RESERVED_PROBABILITY_OF_LOSS)
-        if random_number < loss_probability:
-            logger.debug(f"message lost: {message_content}")
-            logger.info(f"message lost: {message_content}")
+        if _next_rand() < loss_probability:
+            logger.debug("message lost: %s", message_content)
+            logger.info("message lost: %s", message_content)
             corruption_stats.record_message_lost(message_content, loss_probability)
             return None
         else:
             corruption_stats.record_loss_attempt()
 
-    if corruption_info.get(Constants.RESERVED_PROBABILITY_OF_CORRUPTION) is not None:
-        random_number = random.random()
-        corruption_probability = corruption_info.get(Constants.RESERVED_PROBABILITY_OF_CORRUPTION)
-        if random_number < corruption_probability:
+    corruption_probability = corruption_info.get(_CORRUPTION_KEY)
+    if corruption_probability is not None:
+        if _next_rand() < corruption_probability:
             # balagan
             original_content = message_content
-            corrupted_content = corrupt_message_content(message_content, corruption_info.get("corruption"))
+            field_corruption = corruption_info.get("corruption")
+            corrupted_content = corrupt_message_content(message_content, field_corruption)
             if corrupted_content != original_content:
-                corruption_stats.record_message_corrupted(original_content, corrupted_content, corruption_info.get("corruption"))
+                corruption_stats.record_message_corrupted(original_content, corrupted_content, field_corruption)
             return corrupted_content
         else:
             corruption_stats.record_corruption_attempt()
@@ -470,6 +646,85 @@ def corrupt_message(message_content, corruption_info):
     return message_content
 
 
+def _flip_bool(value):
+    """For booleans, flip the value."""
+    return not value
+
+
+def _flip_int_bit(value):
+    """For integers, flip a random bit within the number's bit width."""
+    return value ^ (1 << _random.randrange(value.bit_length() or 1))
+
+
+def _flip_float_bit(value):
+    """For floats, flip a random bit of the 64-bit IEEE 754 representation."""
+    bits = int.from_bytes(struct.pack('<d', value), 'little')
+    bits ^= 1 << _random.getrandbits(6)
+    return struct.unpack('<d', bits.to_bytes(8, 'little'))[0]
+
+
+def _replace_char(value):
+    """For strings, replace a random character, empty strings are left alone (returns None)."""
+    if not value:
+        return None
+    index = _random.randrange(len(value))
+    return value[:index] + _random.choice(_CORRUPTION_CHARACTERS) + value[index + 1:]
+
+
+def _shuffle_list(value):
+    """For lists, shuffle the elements into a new list."""
+    if len(value) < NUMPY_SHUFFLE_MIN_LENGTH:
+        # sampling the full length gives a shuffled copy in one call
+        return _random.sample(value, len(value))
+    # permute the indices in numpy and gather the elements, so element types are never converted
+    return list(map(value.__getitem__, _rng.permutation(len(value)).tolist()))
+
+
+_CORRUPTION_CHARACTERS = string.ascii_letters + string.digits
+
+# from this length on a numpy index permutation shuffles a list faster than random.sample
+NUMPY_SHUFFLE_MIN_LENGTH = 8
+
+# exact value type -> (statistics type name, function returning the corrupted value) for "_RANDOM" corruption
+_RANDOM_CORRUPTION_HANDLERS = {
+    bool: ('bool', _flip_bool),
+    int: ('int', _flip_int_bit),
+    float: ('float', _flip_float_bit),
+    str: ('str', _replace_char),
+    list: ('list', _shuffle_list),
+}
+
+# every value type seen so far -> its handler, or None when the type is not corrupted
+_resolved_corruption_handlers = dict(_RANDOM_CORRUPTION_HANDLERS)
+
+
+def _corruption_handler(value_type):
+    """
+    Find the "_RANDOM" corruption handler of a value type. Exact types are looked up directly; subclasses such
+    as IntEnum members or np.float64 use the nearest base class in the table, and other numeric types such as
+    np.int64 are corrupted as plain ints or floats. bool is in the table itself, so it is never handled as an int.
+
+    Args:
+        value_type (type): The type of the field value
+
+    Returns:
+        tuple: (statistics type name, function returning the corrupted value), or None if the type is not corrupted
+    """
+    try:
+        return _resolved_corruption_handlers[value_type]
+    except KeyError:
+        pass
+    handler = next((_RANDOM_CORRUPTION_HANDLERS[base] for base in value_type.__mro__
+                    if base in _RANDOM_CORRUPTION_HANDLERS), None)
+    if handler is None:
+        if issubclass(value_type, numbers.Integral):
+            handler = ('int', lambda value: _flip_int_bit(int(value)))
+        elif issubclass(value_type, numbers.Real):
+            handler = ('float', lambda value: _flip_float_bit(float(value)))
+    _resolved_corruption_handlers[value_type] = handler
+    return handler
+
+
 def corrupt_message_content(message_content, corruption_info):
     if not isinstance(message_content, dict) or not isinstance(corruption_info, dict):
         return message_content
@@ -485,36 +740,16 @@ def corrupt_message_content(message_content, corruption_info):
         original_value = corrupted_content[field]
 
         if isinstance(corruption_value, str) and corruption_value == "_RANDOM":
-            # Handle random corruption
-            if isinstance(original_value, (int, float)):
-                # For numbers, add random offset
-                # generate random bit between 0 to the size of the number and flip it
-                bit_to_flip = random.randint(0, len(str(original_value)))
-                # flip the bit
-                corrupted_content[field] = original_value ^ (1 << bit_to_flip)
-                corruption_stats.record_field_corruption(field, 'int' if isinstance(original_value, int) else 'float', 
-                                                       original_value, corrupted_content[field])
-
-            elif isinstance(original_value, str):
-                # For strings, either reverse it or add corruption marker
-                if not original_value:
-                    continue
-                index = random.randint(0, len(original_value) - 1)
-                char = random.choice(string.ascii_letters + string.digits)
-                corrupted_content[field] = original_value[:index] + char + original_value[index + 1:]
-                corruption_stats.record_field_corruption(field, 'str', original_value, corrupted_content[field])
-
-            elif isinstance(original_value, bool):
-                # For booleans, flip the value
-                corrupted_content[field] = not original_value
-                corruption_stats.record_field_corruption(field, 'bool', original_value, corrupted_content[field])
-
-            elif isinstance(original_value, list):
-                # For lists, shuffle the elements
-                corrupted_list = original_value.copy()
-                random.shuffle(corrupted_list)
-                corrupted_content[field] = corrupted_list
-                corruption_stats.record_field_corruption(field, 'list', original_value, corrupted_content[field])
+            # Handle random corruption, dispatching on the value's type
+            handler = _corruption_handler(type(original_value))
+            if handler is None:
+                continue
+            corruption_type, corrupt = handler
+            corrupted_value = corrupt(original_value)
+            if corrupted_value is None:
+                continue
+            corrupted_content[field] = corrupted_value
+            corruption_stats.record_field_corruption(field, corruption_type, original_value, corrupted_value)
 
         else:
             # Direct value replacement
@@ -522,7 +757,7 @@ def corrupt_message_content(message_content, corruption_info):
             corruption_stats.record_field_corruption(field, 'direct_replacement', original_value, corruption_value)
 
     # print the original and the corrupted content
-    logger.debug(f"original content: {message_content}\n corrupted content: {corrupted_content}")
+    logger.debug("original content: %s\n corrupted content: %s", message_content, corrupted_content)
 
     return corrupted_content
 
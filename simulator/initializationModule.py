@@ -18,7 +18,7 @@ from simulator.data_structures.custom_min_heap import CustomMinHeap
 from simulator.data_structures.custom_set import CustomSet
 from simulator.data_structures.custom_dict import CustomDict
 from utils.exceptions import *
-from simulator.errorModule import CollapseConfig, ReorderConfig
+from simulator.errorModule import CollapseConfig, ReorderConfig, seed_random_generators
 
 
 class Initialization:
@@ -32,6 +32,7 @@ class Initialization:
         node_values_change (list): A list for tracking changes in node values for display.
         edges_delays (dict): A dictionary of delays associated with network edges.
         network_dict (dict): A dictionary mapping computer IDs to Computer objects.
+        seed (int): The run seed, the collapse configuration's seed when the algorithm has one.
     """
 
     def __init__(self, network_variables):
@@ -58,6 +59,7 @@ class Initialization:
         self.edges_delays = {}  # holds the delays of each edge in the network
         self.collapse_config = None
         self.reorder_config = None
+        self.seed = None  # seed of the run's error module and edge delay draws, set when the algorithm is loaded
         self.load_algorithms(self.algorithm_path)
 
         for comp in self.connected_computers:  # resets the changed flag
@@ -160,8 +162,8 @@ class Initialization:
                 self.root_id = selected_computer.id
 
             for u, v in edges_set:
-                self.network_dict[u].connectedEdges.append(v)
-                self.network_dict[v].connectedEdges.append(u)
+                self.network_dict[u].add_edge(v)
+                self.network_dict[v].add_edge(u)
 
             for id_input in ids_inputs:
                 id_str, attr_str = id_input.split(':')
@@ -321,15 +323,15 @@ class Initialization:
         Returns:
             bool: True if the network is connected, False otherwise.
         """
-        uf = UnionFind(len(self.connected_computers))
+        # position of every computer in connected_computers, instead of searching the list for each edge
+        position = {comp.id: i for i, comp in enumerate(self.connected_computers)}
+        uf = UnionFind(len(position))
 
-        for node in self.connected_computers:
-            for neighbor in node.connectedEdges:
-                uf.union(self.connected_computers.index(node),
-                         self.connected_computers.index(self.find_computer(neighbor)))
+        merges = uf.union_many((position[node.id], position[neighbor])
+                               for node in self.connected_computers for neighbor in node.connectedEdges)
 
-        root = uf.find(0)
-        return all(uf.find(i) == root for i in range(len(self.connected_computers)))
+        # n nodes form a single set after exactly n - 1 successful unions
+        return merges == len(position) - 1
 
     def create_computer_ids(self):
         """
@@ -373,8 +375,8 @@ class Initialization:
 
         if len(self.connected_computers) == 2:
             # Connect the first computer to the second
-            self.connected_computers[0].connectedEdges.append(self.connected_computers[1].id)
-            self.connected_computers[1].connectedEdges.append(self.connected_computers[0].id)
+            self.connected_computers[0].add_edge(self.connected_computers[1].id)
+            self.connected_computers[1].add_edge(self.connected_computers[0].id)
 
         elif len(self.connected_computers) == 3:
             # All possible connected graphs for 3 nodes
@@ -390,8 +392,8 @@ class Initialization:
 
             # Create the connections based on the chosen graph
             for u, v in chosen_edges:
-                self.connected_computers[u].connectedEdges.append(self.connected_computers[v].id)
-                self.connected_computers[v].connectedEdges.append(self.connected_computers[u].id)
+                self.connected_computers[u].add_edge(self.connected_computers[v].id)
+                self.connected_computers[v].add_edge(self.connected_computers[u].id)
 
         else:
             for i, comp in enumerate(self.connected_computers):
@@ -401,13 +403,14 @@ class Initialization:
                 connected_to_vertices = random.sample([j for j in ids_list if j != comp.id], num_edges)
 
                 # Add connections
-                comp.connectedEdges.extend(connected_to_vertices)
+                for connected_to_id in connected_to_vertices:
+                    comp.add_edge(connected_to_id)
 
                 # Ensure bi-directional connection
                 for connected_to_id in connected_to_vertices:
                     for comp_other in self.connected_computers:
                         if comp_other.id == connected_to_id:
-                            comp_other.connectedEdges.append(comp.id)
+                            comp_other.add_edge(comp.id)
                             break
 
             # Remove duplicates
@@ -423,8 +426,8 @@ class Initialization:
         """
         for i in range(self.computer_number - 1):
             # Connect each computer to the next one in line
-            self.connected_computers[i].connectedEdges.append(self.connected_computers[i + 1].id)
-            self.connected_computers[i + 1].connectedEdges.append(
+            self.connected_computers[i].add_edge(self.connected_computers[i + 1].id)
+            self.connected_computers[i + 1].add_edge(
                 self.connected_computers[i].id)  # Ensure bi-directional connection
 
     def create_clique_topology(self):
@@ -435,8 +438,8 @@ class Initialization:
         for i in range(self.computer_number):
             for j in range(i + 1, self.computer_number):
                 # Ensure bi-directional connection
-                self.connected_computers[i].connectedEdges.append(self.connected_computers[j].id)
-                self.connected_computers[j].connectedEdges.append(self.connected_computers[i].id)
+                self.connected_computers[i].add_edge(self.connected_computers[j].id)
+                self.connected_computers[j].add_edge(self.connected_computers[i].id)
 
         # Removing duplicates
         for comp in self.connected_computers:
@@ -460,15 +463,15 @@ class Initialization:
 
                 if i not in prufer_sequence:
                     j = prufer_sequence[0]  # Always connect to the first node in S
-                    i.connectedEdges.append(j.id)
-                    j.connectedEdges.append(i.id)
+                    i.add_edge(j.id)
+                    j.add_edge(i.id)
                     prufer_sequence.remove(j)
                     extra_list.remove(i)
 
         # Connect the last two nodes in L
         if len(extra_list) == 2:
-            extra_list[0].connectedEdges.append(extra_list[1].id)
-            extra_list[1].connectedEdges.append(extra_list[0].id)
+            extra_list[0].add_edge(extra_list[1].id)
+            extra_list[1].add_edge(extra_list[0].id)
 
     def create_star_topology(self):
         """
@@ -485,8 +488,8 @@ class Initialization:
         # Connect all other nodes to the hub
         for comp in self.connected_computers:
             if comp.id != root.id:
-                root.connectedEdges.append(comp.id)
-                comp.connectedEdges.append(root.id)  # Ensure bi-directional connection
+                root.add_edge(comp.id)
+                comp.add_edge(root.id)  # Ensure bi-directional connection
 
     def load_algorithms(self, algorithm_module_path):
         """
@@ -514,6 +517,11 @@ class Initialization:
                 collapse_config = getattr(algorithm_module, 'collapse_config')
                 logger.debug(f"Found collapse configuration in {base_file_name}: {collapse_config}")
                 self.collapse_config = CollapseConfig(collapse_config)
+                self.collapse_config.set_total_nodes(len(self.connected_computers))
+
+            # the collapse configuration's seed is the run seed, seeded before the reorder dice are rolled
+            self.seed = self.collapse_config.seed if self.collapse_config is not None else random.getrandbits(64)
+            seed_random_generators(self.seed)
 
             if hasattr(algorithm_module, 'reorder_config'):
                 reorder_messages = getattr(algorithm_module, 'reorder_config')
@@ -521,7 +529,7 @@ class Initialization:
                 self.reorder_config = ReorderConfig(reorder_messages)
 
             for comp in self.connected_computers:
-                comp.algorithm_file = algorithm_module
+                comp.set_algorithm_file(algorithm_module)
 
         except ImportError:
             logger.error(f"Error: Unable to import {base_file_name}.py")
@@ -2,18 +2,30 @@
 Message class for representing messages in the distributed network simulation.
 """
 
+# largest number of released messages kept around for reuse
+MESSAGE_POOL_SIZE = 1 << 15
+
 class Message:
     """
     A class representing a message in the distributed network simulation.
-    
+    Delivered messages are released back to a pool and reused for later sends, so a Message object
+    must not be kept after delivery. Keep its content instead, the content itself is never reused.
+
     Attributes:
         source_id (int): The ID of the source computer sending the message.
         dest_id (int): The ID of the destination computer receiving the message.
         arrival_time (float): The time at which the message will arrive.
         content (str): The content/payload of the message.
+        dest_computer (Computer): The destination computer, if known when the message is created.
     """
+
+    # fixed attribute layout, many messages are alive at once and the schedulers read these fields constantly
+    __slots__ = ('source_id', 'dest_id', 'arrival_time', 'content', 'dest_computer')
+
+    # released messages waiting to be reused by acquire(), so busy runs do not allocate a new object per hop
+    _pool = []
     
-    def __init__(self, source_id: int, dest_id: int, arrival_time: float, content: str):
+    def __init__(self, source_id: int, dest_id: int, arrival_time: float, content: str, dest_computer=None):
         """
         Initialize a new Message instance.
         
@@ -22,12 +34,48 @@ class Message:
             dest_id (int): The ID of the destination computer.
             arrival_time (float): The time at which the message will arrive.
             content (str): The content/payload of the message.
+            dest_computer (Computer, optional): The destination computer, saves looking it up on delivery.
         """
         self.source_id = source_id
         self.dest_id = dest_id
         self.arrival_time = arrival_time
         self.content = content
+        self.dest_computer = dest_computer
     
+    @classmethod
+    def acquire(cls, source_id: int, dest_id: int, arrival_time: float, content: str, dest_computer=None) -> 'Message':
+        """
+        Create a message, reusing a released one when available. Takes the same arguments as the constructor.
+
+        Returns:
+            Message: A message holding the given fields.
+        """
+        pool = cls._pool
+        if not pool:
+            return cls(source_id, dest_id, arrival_time, content, dest_computer)
+        message = pool.pop()
+        message.source_id = source_id
+        message.dest_id = dest_id
+        message.arrival_time = arrival_time
+        message.content = content
+        message.dest_computer = dest_computer
+        return message
+
+    @classmethod
+    def release(cls, message: 'Message'):
+        """
+        Return a message that has been delivered or dropped so acquire() can reuse it.
+        The caller must not keep any reference to the message afterwards.
+
+        Args:
+            message (Message): The message to release.
+        """
+        # drop the payload and the computer now so a pooled message keeps nothing alive
+        message.content = None
+        message.dest_computer = None
+        if len(cls._pool) < MESSAGE_POOL_SIZE:
+            cls._pool.append(message)
+
     def to_dict(self) -> dict:
         """
         Convert the message to a dictionary format.
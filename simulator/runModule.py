@@ -7,6 +7,7 @@ This module initializes the network, runs the algorithms on each computer, and m
 import simulator.initializationModule as initializationModule
 import simulator.communication as communication
 from simulator.config import NodeState
+from simulator.message import Message
 from utils.logger_config import logger
 from simulator.Constants import *
 from simulator.errorModule import log_all_error_statistics
@@ -52,9 +53,12 @@ def async_run(network: initializationModule.Initialization, comm: communication.
     logger.info("************************************************************************************")
 
     ## runs mainAlgorithm
-    while not network.message_queue.empty():
-        message = network.message_queue.pop()
-        comm.receive_message(message, comm)
+    message_queue = network.message_queue
+    while not message_queue.empty():
+        # all messages arriving at the earliest time are popped in one go, messages they cause arrive later
+        for message in message_queue.pop_until(message_queue.peek_time()):
+            comm.receive_message(message, comm)
+            Message.release(message)
         # comp = network.network_dict.get(message.dest_id)
         # network.collapse_config.should_collapse(comp, message)
 
@@ -85,22 +89,25 @@ def sync_run(network: initializationModule.Initialization, comm: communication.C
         all_terminated = len(network.connected_computers)
 
         for comp in network.connected_computers:
-            if comp.state == NodeState.TERMINATED or comp.state == NodeState.COLLAPSED:
+            if comp.state is NodeState.TERMINATED or comp.state is NodeState.COLLAPSED:
                 all_terminated -= 1
                 continue
 
-            # Get messages for the current computer from the dictionary and clear the key
+            # Get messages for the current computer from the dictionary, this also removes them
             current_messages = network.message_queue.get_messages_for_specific_dest(comp.id, current_round)
             #logger.info("Current messages for computer %s: %s", comp.id, current_messages)
-            network.message_queue.clear_key(comp.id)
 
             # Update received message count for each message
             comp.update_received_msg_count(len(current_messages))
 
-            # we want to take only the content of each message and send as alist
-            current_messages = [message.content for message in current_messages]
-            network.collapse_config.should_collapse(comp, current_round, current_messages)
-            comm.run_algorithm(comp, 'mainAlgorithm', current_round, current_messages)
+            # we want to take only the content of each message and send as a list, reusing the computer's inbox
+            inbox = comp._inbox
+            inbox.clear()
+            inbox.extend(message.content for message in current_messages)
+            for message in current_messages:
+                Message.release(message)
+            network.collapse_config.should_collapse(comp, current_round, inbox)
+            comm.run_algorithm(comp, 'mainAlgorithm', current_round, inbox)
 
         # randomly collapse:
         network.collapse_config.maybe_collapse_randomly(network.network_dict)
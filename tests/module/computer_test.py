@@ -0,0 +1,34 @@
+from types import ModuleType, SimpleNamespace
+
+from simulator.communication import Communication
+from simulator.computer import Computer
+
+
+def algorithm_module():
+    module = ModuleType("assigned_algorithm")
+    module.calls = []
+    module.init = lambda comp, communication: module.calls.append(("init", comp.id))
+    module.mainAlgorithm = lambda comp, communication, arrival_time, message: module.calls.append(("main", message))
+    return module
+
+
+def test_assigning_algorithm_file_runs_it():
+    module = algorithm_module()
+    comp = Computer(3)
+    comp.algorithm_file = module
+    comm = SimpleNamespace(network=SimpleNamespace(display_type="Text"))
+
+    Communication.run_algorithm(comm, comp, 'init')
+    Communication.run_algorithm(comm, comp, 'mainAlgorithm', 1, "hello")
+
+    assert comp.algorithm_file is module
+    assert module.calls == [("init", 3), ("main", "hello")]
+
+
+def test_replacing_algorithm_file_clears_missing_entry_points():
+    comp = Computer(1)
+    comp.set_algorithm_file(algorithm_module())
+    comp.algorithm_file = ModuleType("no_main")
+
+    assert comp._init_algorithm is None
+    assert comp._main_algorithm is None
@@ -0,0 +1,55 @@
+from simulator.data_structures.custom_dict import CustomDict
+from simulator.message import Message
+
+
+def test_push_and_push_many_count_messages():
+    inbox = CustomDict()
+    inbox.push(Message(1, 2, 1, "a"))
+    inbox.push_many([Message(1, 3, 1, "b"), Message(2, 3, 2, "c")])
+
+    assert inbox.size() == 3
+    assert inbox.total_messages_sent == 3
+    assert not inbox.empty()
+    assert sorted(message.content for message in inbox.get_all_messages()) == ["a", "b", "c"]
+
+
+def test_draining_one_destination_leaves_the_others():
+    inbox = CustomDict()
+    inbox.push_many([Message(1, 3, 1, "b"), Message(2, 3, 1, "c"), Message(3, 3, 2, "later"), Message(1, 2, 1, "a")])
+
+    delivered = inbox.get_messages_for_specific_dest(3, 1)
+
+    assert [message.content for message in delivered] == ["b", "c"]
+    assert inbox.size() == 2
+    assert inbox.total_messages_received == 2
+    # the next round of the same destination and other destinations are untouched
+    assert [message.content for message in inbox.get_messages_for_specific_dest(3, 2)] == ["later"]
+    assert [message.content for message in inbox.get_messages_for_specific_dest(2, 1)] == ["a"]
+    assert inbox.empty()
+    assert inbox.size() == 0
+
+
+def test_empty_destination_or_round_returns_nothing():
+    inbox = CustomDict()
+    assert inbox.get_messages_for_specific_dest(5, 1) == []
+
+    inbox.push(Message(1, 5, 2, "a"))
+    assert inbox.get_messages_for_specific_dest(5, 1) == []
+    assert inbox.get_messages_for_specific_dest(7, 2) == []
+    assert inbox.size() == 1
+    assert inbox.total_messages_received == 0
+
+
+def test_remove_and_clear_key_keep_the_count():
+    inbox = CustomDict()
+    kept = Message(1, 2, 1, "kept")
+    removed = Message(1, 2, 1, "removed")
+    inbox.push_many([kept, removed, Message(1, 4, 1, "x"), Message(1, 4, 3, "y")])
+
+    inbox.remove(removed)
+    assert not inbox.contains(removed)
+    assert inbox.contains(kept)
+
+    inbox.clear_key(4)
+    assert inbox.size() == 1
+    assert inbox.get_all_messages() == [kept]
@@ -0,0 +1,60 @@
+import pytest
+
+from simulator.data_structures.custom_min_heap import CustomMinHeap
+from simulator.message import Message
+
+
+def contents(messages):
+    return [message.content for message in messages]
+
+
+def test_pop_until_on_empty_heap():
+    heap = CustomMinHeap()
+    assert heap.pop_until(10) == []
+    assert heap.empty()
+    assert heap.total_messages_received == 0
+
+
+def test_pop_until_takes_equal_times_in_push_order():
+    heap = CustomMinHeap()
+    for content, time in [("a", 1.0), ("b", 0.5), ("c", 1.0), ("d", 2.0), ("e", 1.0)]:
+        heap.push(Message(1, 2, time, content))
+
+    assert heap.peek_time() == 0.5
+    assert contents(heap.pop_until(heap.peek_time())) == ["b"]
+    assert heap.peek_time() == 1.0
+    assert contents(heap.pop_until(heap.peek_time())) == ["a", "c", "e"]
+    assert heap.size() == 1
+    assert heap.total_messages_received == 4
+
+
+def test_pop_until_boundary_time():
+    heap = CustomMinHeap()
+    for time in [1.0, 2.0, 3.0]:
+        heap.push(Message(1, 2, time, time))
+
+    # a message arriving exactly at the given time is included, the next one is not
+    assert heap.pop_until(0.999) == []
+    assert contents(heap.pop_until(2.0)) == [1.0, 2.0]
+    assert heap.peek_time() == 3.0
+    assert contents(heap.pop_until(float("inf"))) == [3.0]
+    assert heap.empty()
+
+
+@pytest.mark.parametrize("existing", [0, 1, 10])
+def test_push_many_keeps_heap_order(existing):
+    # fewer new entries than queued ones sift in, more rebuild the heap
+    heap = CustomMinHeap()
+    for i in range(existing):
+        heap.push(Message(1, 2, (i * 7) % 5, f"old{i}"))
+    times = [3, 0, 3, 1, 4, 0]
+    heap.push_many([Message(1, 2, time, f"new{i}") for i, time in enumerate(times)])
+
+    popped = [heap.pop() for _ in range(heap.size())]
+    order = [(message.arrival_time, message.content) for message in popped]
+
+    assert [time for time, _ in order] == sorted(time for time, _ in order)
+    # equal arrival times come out in push order
+    new_order = [content for _, content in order if content.startswith("new")]
+    assert new_order == [f"new{i}" for i in sorted(range(len(times)), key=lambda i: times[i])]
+    assert heap.total_messages_sent == existing + len(times)
@@ -0,0 +1,27 @@
+from simulator.data_structures.custom_set import CustomSet
+
+
+def test_remove_drops_only_that_message():
+    messages = CustomSet()
+    first = {"source": 1, "dest": 2, "type": "ping"}
+    second = {"source": 2, "dest": 1, "type": "pong"}
+    messages.push(first)
+    messages.push(second)
+
+    # a dict with the same items built in another order is the same message
+    messages.remove({"type": "ping", "dest": 2, "source": 1})
+
+    assert not messages.contains(first)
+    assert messages.contains(second)
+    assert messages.size() == 1
+    assert messages.get_all_messages() == [second]
+
+
+def test_remove_last_message_empties_the_set():
+    messages = CustomSet()
+    message = {"source": 1, "dest": 2}
+    messages.push(message)
+    messages.remove(message)
+
+    assert messages.empty()
+    assert messages.size() == 0
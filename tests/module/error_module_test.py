@@ -0,0 +1,78 @@
+from enum import IntEnum
+
+import numpy as np
+import pytest
+
+from simulator.computer import Computer
+from simulator.errorModule import (POISSON_ICDF_MAX_LAMBDA, CollapseConfig, ReorderConfig, _poisson_draw, _poisson_icdf,
+                                   corrupt_message_content, seed_random_generators)
+
+
+class Level(IntEnum):
+    LOW = 5
+
+
+def corrupt_all_fields(content):
+    return corrupt_message_content(content, {field: "_RANDOM" for field in content})
+
+
+def test_bool_is_flipped_not_bit_corrupted():
+    corrupted = corrupt_all_fields({"flag": True, "other": False})
+    assert corrupted == {"flag": False, "other": True}
+
+
+def test_int_and_float_subclasses_are_corrupted():
+    content = {"level": Level.LOW, "weight": np.float64(2.5), "count": np.int64(6)}
+    corrupted = corrupt_all_fields(content)
+
+    for field, value in content.items():
+        assert corrupted[field] != value, f"{field} was not corrupted"
+
+    # integers differ from the original value in exactly one bit
+    assert bin(corrupted["level"] ^ 5).count("1") == 1
+    assert bin(corrupted["count"] ^ 6).count("1") == 1
+    assert isinstance(corrupted["weight"], float)
+
+
+def test_unsupported_types_are_left_alone():
+    content = {"nothing": None, "mapping": {"a": 1}, "empty": ""}
+    assert corrupt_all_fields(content) == content
+
+
+@pytest.mark.parametrize("lam", [1, 3.5, 12, POISSON_ICDF_MAX_LAMBDA])
+def test_poisson_icdf_mean_and_variance(lam):
+    # evenly spaced uniforms make the result deterministic
+    samples = 20000
+    draws = np.array([_poisson_icdf(lam, (i + 0.5) / samples) for i in range(samples)])
+    assert draws.mean() == pytest.approx(lam, rel=0.02)
+    assert draws.var() == pytest.approx(lam, rel=0.05)
+
+
+def test_poisson_icdf_extreme_uniforms():
+    assert _poisson_icdf(1, 0.0) == 0
+    # the walk stops once the tail underflows instead of looping forever
+    assert _poisson_icdf(1, 1 - 2 ** -53) < 30
+
+
+@pytest.mark.parametrize("lam", [2, POISSON_ICDF_MAX_LAMBDA + 10, 200])
+def test_poisson_draw_mean_and_variance(lam):
+    # above the cap the draw falls back to numpy
+    draws = np.array([_poisson_draw(lam) for _ in range(20000)])
+    assert draws.mean() == pytest.approx(lam, rel=0.05)
+    assert draws.var() == pytest.approx(lam, rel=0.1)
+
+
+def test_seeded_generators_replay_draws():
+    content = {"text": "payload", "count": 12, "weight": 0.25, "short": [1, 2, 3], "long": list(range(20))}
+    reorder = {f"({i},{i + 1})": 0.5 for i in range(20)}
+
+    def run(seed):
+        seed_random_generators(seed)
+        collapse_config = CollapseConfig({"overall": 0.5, "rounds_number": 1})
+        computers = {i: Computer(i) for i in range(50)}
+        collapse_config.maybe_collapse_randomly(computers)
+        return (corrupt_all_fields(content), [_poisson_draw(50) for _ in range(5)],
+                ReorderConfig(reorder).unordered_edges, collapse_config.collapsed_nodes)
+
+    assert run(7) == run(7)
+    assert run(7) != run(8)
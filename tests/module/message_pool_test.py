@@ -0,0 +1,73 @@
+import textwrap
+
+import pytest
+
+from simulator.message import Message
+
+# every node greets its neighbors, and answers each greeting, so the answers reuse released greetings
+ALGORITHM = textwrap.dedent('''
+    from simulator.config import NodeState
+
+    reorder_config = {
+
+    }
+
+
+    collapse_config = {
+
+    }
+
+
+    def init(self, communication):
+        self.received = []
+        self.state = NodeState.ACTIVE
+        communication.send_to_all(self.id, ("first", self.id, [self.id]))
+
+
+    def receive(self, communication, arrival_time, content):
+        self.received.append(content)
+        if content[0] == "first":
+            communication.send_message(self.id, content[1], ("second", self.id, [self.id]), arrival_time)
+        if sum(received[0] == "second" for received in self.received) == len(self.connectedEdges):
+            self.state = NodeState.TERMINATED
+
+
+    def mainAlgorithm(self, communication, arrival_time, message=None):
+        if isinstance(message, list):
+            for content in message:
+                receive(self, communication, arrival_time, content)
+        else:
+            receive(self, communication, arrival_time, message)
+''')
+
+
+@pytest.mark.parametrize("sync", ["Sync", "Async"])
+def test_delivered_content_survives_release(sync, tmp_path):
+    from simulator import initializationModule, communication, runModule
+
+    algorithm_file = tmp_path / "message_pool_algorithm.py"
+    algorithm_file.write_text(ALGORITHM)
+    network_variables = {
+        "Algorithm": str(algorithm_file),
+        "Topology File": "topologyFiles/tree.txt",
+        "Topology": "Custom",
+        "Root": "Custom",
+        "ID Type": "Custom",
+        "Sync": sync,
+        "Delay": "Constant",
+        "Display": "Text",
+        "Logging": "Short",
+        "Number of Computers": "10"
+    }
+    network = initializationModule.Initialization(network_variables)
+    comm = communication.Communication(network)
+    runModule.initiateRun(network, comm, sync)
+
+    for node_id, node in network.network_dict.items():
+        expected = {(kind, neighbor, (neighbor,)) for kind in ("first", "second") for neighbor in node.connectedEdges}
+        received = {(kind, sender, tuple(payload)) for kind, sender, payload in node.received}
+        assert received == expected, f"Node {node_id} lost delivered content"
+
+    # the delivered messages went back to the pool without holding on to their content
+    assert Message._pool
+    assert all(message.content is None and message.dest_computer is None for message in Message._pool)
@@ -0,0 +1,100 @@
+import pytest
+
+from simulator.config import NodeState
+
+
+def build_network(sync):
+    from simulator import initializationModule, communication
+
+    network_variables = {
+        "Algorithm": "algorithms/BFSalgorithm.py",
+        "Topology File": "topologyFiles/line.txt",
+        "Topology": "Custom",
+        "Root": "Custom",
+        "ID Type": "Custom",
+        "Sync": sync,
+        "Delay": "Constant",
+        "Display": "Text",
+        "Logging": "Short",
+        "Number of Computers": "5"
+    }
+    network = initializationModule.Initialization(network_variables)
+    return network, communication.Communication(network)
+
+
+def queued_contents(network, sync):
+    queue = network.message_queue
+    if sync == "Sync":
+        return [message.content for message in queue.get_messages_for_specific_dest(2, 1)]
+    return [queue.pop().content for _ in range(queue.size())]
+
+
+@pytest.mark.parametrize("sync", ["Sync", "Async"])
+def test_send_many_keeps_sending_order(sync):
+    network, comm = build_network(sync)
+    comm.send_many(1, 2, ["a", "b", "c"])
+    comm.send_many(1, 2, ["d"], sent_time=0)
+
+    assert network.message_queue.size() == 4
+    assert network.network_dict[1].sent_msg_count == 4
+    assert queued_contents(network, sync) == ["a", "b", "c", "d"]
+
+
+@pytest.mark.parametrize("sync", ["Sync", "Async"])
+def test_send_many_matches_send_message_arrival_times(sync):
+    network, comm = build_network(sync)
+    comm.send_many(1, 2, ["a", "b"], sent_time=3)
+    comm.send_message(1, 2, "c", sent_time=3)
+
+    queue = network.message_queue
+    if sync == "Sync":
+        arrival_times = {message.arrival_time for message in queue.get_all_messages()}
+    else:
+        arrival_times = {arrival_time for arrival_time, _, _ in queue.heap}
+    assert len(arrival_times) == 1
+
+
+@pytest.mark.parametrize("sync", ["Sync", "Async"])
+def test_send_many_from_collapsed_source(sync):
+    network, comm = build_network(sync)
+    network.network_dict[1].state = NodeState.COLLAPSED
+    comm.send_many(1, 2, ["a", "b"])
+
+    assert network.message_queue.size() == 0
+    assert network.network_dict[1].sent_msg_count == 0
+
+
+@pytest.mark.parametrize("sync", ["Sync", "Async"])
+def test_send_many_to_inactive_destination(sync):
+    network, comm = build_network(sync)
+    network.network_dict[2].state = NodeState.TERMINATED
+    comm.send_many(1, 2, ["a", "b"])
+
+    assert network.message_queue.size() == 0
+    assert network.network_dict[1].sent_msg_count == 0
+
+
+@pytest.mark.parametrize("sync", ["Sync", "Async"])
+def test_send_many_to_unconnected_destination(sync):
+    network, comm = build_network(sync)
+    comm.send_many(1, 3, ["a", "b"])
+
+    assert network.message_queue.size() == 0
+
+
+def test_random_edge_delays_follow_the_run_seed():
+    from simulator import communication
+    from simulator.errorModule import ReorderConfig
+
+    def delays(seed):
+        network, _ = build_network("Async")
+        network.delay_type = "Random"
+        network.reorder_config = ReorderConfig()
+        network.seed = seed
+        comm = communication.Communication(network)
+        comm.send_to_all(2, "a")
+        comm.send_many(2, 1, ["b", "c"])
+        return sorted(arrival_time for arrival_time, _, _ in network.message_queue.heap)
+
+    assert delays(7) == delays(7)
+    assert delays(7) != delays(8)
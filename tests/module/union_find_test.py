@@ -0,0 +1,54 @@
+from types import SimpleNamespace
+
+from simulator.data_structures.union_find import UnionFind
+from simulator.initializationModule import Initialization
+
+
+def test_repeated_unions_and_self_loops_do_not_count_as_merges():
+    uf = UnionFind(4)
+    assert uf.union(0, 1)
+    assert not uf.union(1, 0)
+    assert not uf.union(2, 2)
+
+    merges = uf.union_many([(0, 1), (1, 0), (3, 3), (1, 2), (0, 2)])
+
+    assert merges == 1
+    assert uf.find(0) == uf.find(1) == uf.find(2)
+    assert uf.find(3) == 3
+
+
+def test_disconnected_graph_keeps_separate_sets():
+    uf = UnionFind(6)
+    merges = uf.union_many([(0, 1), (1, 2), (3, 4), (4, 3)])
+
+    assert merges == 3
+    assert uf.find(0) == uf.find(2)
+    assert uf.find(3) == uf.find(4)
+    assert uf.find(0) != uf.find(3)
+    assert uf.find(5) == 5
+
+
+def test_long_chain_does_not_recurse():
+    size = 10000
+    uf = UnionFind(size)
+    # link the roots by hand into one long chain, then let find compress it
+    uf.parent = [max(node - 1, 0) for node in range(size)]
+    assert uf.find(size - 1) == 0
+    assert uf.parent[size - 1] == 0
+
+
+def network(edges):
+    # is_connected only needs the computers and their edges, not a full initialization
+    initialization = Initialization.__new__(Initialization)
+    initialization.connected_computers = [SimpleNamespace(id=node_id, connectedEdges=neighbors)
+                                          for node_id, neighbors in edges.items()]
+    return initialization
+
+
+def test_is_connected():
+    # every edge appears in both directions, which must not inflate the merge count
+    assert network({10: [20], 20: [10, 30], 30: [20]}).is_connected()
+    assert network({10: [20, 30], 20: [10, 30], 30: [10, 20]}).is_connected()
+    assert network({10: []}).is_connected()
+    assert not network({10: [20], 20: [10], 30: [40], 40: [30]}).is_connected()
+    assert not network({10: [10, 20], 20: [10], 30: [30]}).is_connected()
@@ -265,4 +265,42 @@ def test_complete_gui_workflow_with_simulation(qtbot):
         elif os.path.exists(original_vars_file):
             os.remove(original_vars_file)
 
-    
\ No newline at end of file
+    
+
+@pytest.mark.gui
+def test_submit_with_pending_invalid_number_is_rejected(qtbot, tmp_path, monkeypatch):
+    """Submitting before the number input debounce fires must not save a rejected number."""
+    from PyQt5.QtWidgets import QMessageBox
+    from simulator import MainMenu
+    from simulator.MainMenu import MenuWindow
+
+    saved_file = tmp_path / "network_variables.json"
+    monkeypatch.setattr(MainMenu, "NETWORK_VARIABLES", str(saved_file))
+
+    menu_window = MenuWindow({
+        "Algorithm": "algorithms/BFSalgorithm.py",
+        "Topology File": "",
+        "Topology": "Random",
+        "Root": "Random",
+        "ID Type": "Sequential",
+        "Sync": "Async",
+        "Delay": "Random",
+        "Display": "Text",
+        "Logging": "Short",
+        "Number of Computers": ""
+    })
+    qtbot.addWidget(menu_window)
+
+    with patch.object(QMessageBox, 'warning') as mock_warning:
+        # a valid number enables submit, then an invalid one is typed and submitted before the timer fires
+        menu_window.number_input.setText("10")
+        menu_window.on_number_input_settled()
+        assert menu_window.submit_button.isEnabled()
+
+        menu_window.number_input.setText("10x")
+        assert menu_window.number_input_timer.isActive()
+        menu_window.on_submit_all()
+
+    mock_warning.assert_called_once()
+    assert not menu_window.submit_button.isEnabled()
+    assert not saved_file.exists()